@@ -0,0 +1,40 @@
+"""Add post listing indexes
+
+Revision ID: 3b8f1c2d9e4a
+Revises: f84733e6e63c
+Create Date: 2026-10-18 09:12:41.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8f1c2d9e4a'
+down_revision = 'f84733e6e63c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Author listings: WHERE author_id = ? ORDER BY created_at DESC, id DESC
+    op.create_index(
+        'ix_posts_author_id_created_at_id',
+        'posts',
+        ['author_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+    # Public feed: only published posts, in listing order
+    op.create_index(
+        'ix_posts_published_created_at_id',
+        'posts',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text("is_published = true AND status = 'published'"),
+        sqlite_where=sa.text("is_published = 1 AND status = 'published'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_posts_published_created_at_id', table_name='posts')
+    op.drop_index('ix_posts_author_id_created_at_id', table_name='posts')
@@ -0,0 +1,6 @@
+"""Performance benchmarks."""
+import os
+import tempfile
+
+# Scratch database the benchmarks seed, unless given --database-url
+DEFAULT_DATABASE_URL = f"sqlite:///{os.path.join(tempfile.gettempdir(), 'fastapi_template_bench.db')}"
@@ -0,0 +1,49 @@
+"""Benchmark decode_access_token with and without the verified-token cache.
+
+Run with:
+    python -m benchmarks.bench_jwt_decode --output jwt_decode.json
+"""
+import argparse
+from datetime import timedelta
+from benchmarks.results import build_results, print_results, write_results
+from benchmarks.timing import bench
+from src.auth import utils
+from src.cache import TTLCache
+
+
+def bench_decode(token: str, cache: TTLCache, iterations: int) -> dict:
+    """Time decoding one token with the given token cache installed."""
+    utils.token_cache = cache
+    return bench(lambda: utils.decode_access_token(token), iterations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JWT decoding with and without the token cache.")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    token = utils.create_access_token(
+        data={"sub": "bench@example.com", "user_id": 1},
+        expires_delta=timedelta(minutes=30)
+    )
+    original_cache = utils.token_cache
+    try:
+        results = {
+            "decode_access_token uncached": bench_decode(token, TTLCache(maxsize=0, ttl=0), args.iterations),
+            "decode_access_token cached": bench_decode(token, TTLCache(maxsize=1000, ttl=300), args.iterations),
+        }
+    finally:
+        utils.token_cache = original_cache
+
+    data = build_results("jwt_decode", vars(args), results)
+    print_results(data)
+    speedup = results["decode_access_token uncached"]["mean_ms"] / results["decode_access_token cached"]["mean_ms"]
+    print(f"\ncache speedup: {speedup:.1f}x")
+    if args.output:
+        write_results(args.output, data)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
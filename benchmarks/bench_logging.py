@@ -0,0 +1,165 @@
+"""Benchmark request throughput with access logging off, synchronous and queued.
+
+"sync" is the previous setup: text file and stream handlers called on the event loop.
+"queued" is the current one: JSON records written by the QueueListener thread.
+Logs go to temporary files; --write-latency-ms adds a delay to every write, as a slow
+disk or a stdout pipe the log collector isn't draining would.
+
+Run with:
+    python -m benchmarks.bench_logging --requests 3000 --output logging.json
+    python -m benchmarks.bench_logging --write-latency-ms 1
+"""
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+import httpx
+from benchmarks import DEFAULT_DATABASE_URL
+from benchmarks.load import SCENARIOS, LoadContext, run_scenario
+from benchmarks.results import build_results, print_results, write_results
+
+ENDPOINTS = ["GET /health", "GET /api/v1/posts/", "GET /api/v1/posts/{post_id}"]
+
+# Mode -> access log sample rate, or None when access logging is off
+MODES = {
+    "off": None,
+    "sync": 1.0,
+    "queued": 1.0,
+    "queued 10% sampled": 0.1,
+}
+
+# The format of the old logging.ini file handler
+SYNC_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s - %(lineno)d - %(message)s"
+
+
+class SlowStream:
+    """File wrapper that sleeps before every write."""
+
+    def __init__(self, stream, latency: float):
+        self.stream = stream
+        self.latency = latency
+
+    def write(self, text: str) -> int:
+        if self.latency:
+            time.sleep(self.latency)
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+def find_middleware(app, middleware_class):
+    """Find a middleware instance in a built Starlette middleware stack."""
+    current = app.middleware_stack
+    while current is not None:
+        if isinstance(current, middleware_class):
+            return current
+        current = getattr(current, "app", None)
+    raise LookupError(f"{middleware_class.__name__} is not installed")
+
+
+def use_mode(mode: str, directory: str, write_latency: float) -> list[logging.Handler]:
+    """Configure logging for a mode, returning the handlers whose streams to close afterwards."""
+    from src.logging_config import ACCESS_LOGGER_NAME, JSONFormatter, configure_logging, stop_logging
+
+    stop_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+    access_logger.setLevel(logging.INFO if MODES[mode] is not None else logging.WARNING)
+
+    # Like the old file and console handlers, with a file standing in for stdout
+    file_name = mode.replace(" ", "_").replace("%", "pct")
+    handlers: list[logging.Handler] = []
+    for extension in ("log", "stdout"):
+        stream = open(os.path.join(directory, f"{file_name}.{extension}"), "w")
+        handlers.append(logging.StreamHandler(SlowStream(stream, write_latency)))
+    if mode == "sync":
+        for handler in handlers:
+            handler.setFormatter(logging.Formatter(SYNC_FORMAT))
+            root.addHandler(handler)
+        root.setLevel(logging.INFO)
+    elif mode != "off":
+        for handler in handlers:
+            handler.setFormatter(JSONFormatter())
+        configure_logging(level="INFO", handlers=handlers)
+    return handlers
+
+
+async def run(args: argparse.Namespace, directory: str) -> dict:
+    """Run every endpoint under every logging mode."""
+    from benchmarks.seed import SEED_PASSWORD
+    from src.logging_config import stop_logging
+    from src.main import app
+    from src.middleware import AccessLogMiddleware
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            context = LoadContext(client, SEED_PASSWORD, args.users, args.posts, args.seed)
+            await client.get("/health")
+            access_log = find_middleware(app, AccessLogMiddleware)
+
+            for mode, sample_rate in MODES.items():
+                handlers = use_mode(mode, directory, args.write_latency_ms / 1000)
+                access_log.sample_rate = sample_rate or 0.0
+                try:
+                    for endpoint in ENDPOINTS:
+                        scenario = SCENARIOS[endpoint]
+                        await run_scenario(context, scenario, args.warmup, args.concurrency)
+                        name = f"{endpoint} [{mode}]"
+                        results[name] = await run_scenario(context, scenario, args.requests, args.concurrency)
+                        print(f"  {name}: {results[name]['throughput_rps']:.1f} req/s")
+                finally:
+                    stop_logging()
+                    for handler in handlers:
+                        handler.stream.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark throughput with logging off vs. on.")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=3000, help="Requests per endpoint and mode")
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--write-latency-ms", type=float, default=0.0, help="Simulated delay per log write")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    # Settings are read when src is first imported, so configure the app first
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    os.environ["DB_WARMUP_CONNECTIONS"] = "0"
+    os.environ["ACCESS_LOG_ENABLED"] = "true"
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import make_url
+    from benchmarks.seed import seed_database
+
+    seed_database(create_engine(args.database_url), users=args.users, posts=args.posts, seed=args.seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = asyncio.run(run(args, directory))
+
+    parameters = {**vars(args), "database_url": make_url(args.database_url).render_as_string(hide_password=True)}
+    data = build_results("logging", parameters, results)
+    print()
+    print_results(data)
+    if args.output:
+        write_results(args.output, data)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark bytes fetched per listing page with full rows vs. projected columns.
+
+Run with:
+    python -m benchmarks.bench_post_payload --content-size 8000 --output post_payload.json
+"""
+import argparse
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, undefer
+from benchmarks.results import build_results, print_results, write_results
+from benchmarks.seed import DEFAULT_DATABASE_URL, seed_database
+from benchmarks.timing import bench
+from src.pagination import PaginationParams
+from src.posts import models
+from src.posts.service import build_posts_query, paginate_posts_query
+
+
+def row_bytes(values) -> int:
+    """Approximate the wire size of a row by its encoded values."""
+    return sum(len(str(value).encode("utf-8")) for value in values if value is not None)
+
+
+def measure(session: Session, statement, fetch, repeat: int) -> dict:
+    """Time fetching a page, adding its size in bytes to the results."""
+    rows = []
+
+    def fetch_page():
+        nonlocal rows
+        session.expunge_all()
+        rows = fetch(session.execute(statement))
+
+    result = bench(fetch_page, repeat)
+    result["bytes_per_page"] = sum(row_bytes(row) for row in rows)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark listing payload size.")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--content-size", type=int, default=8000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    seed_database(engine, posts=args.posts, content_size=args.content_size)
+    pagination = PaginationParams(page_size=args.page_size)
+
+    # Previous listing: whole ORM rows, content included
+    full_rows = paginate_posts_query(
+        select(models.Post).options(undefer(models.Post.content)), pagination
+    )
+    full_columns = [column.key for column in models.Post.__table__.columns]
+
+    def fetch_full(result):
+        return [[getattr(post, key) for key in full_columns] for post in result.scalars().all()]
+
+    # Current listing: only the PostListResponse columns
+    projected = paginate_posts_query(build_posts_query(), pagination)
+
+    with Session(engine) as session:
+        results = {
+            "listing page full rows": measure(session, full_rows, fetch_full, args.repeat),
+            "listing page projected columns": measure(session, projected, lambda result: result.all(), args.repeat),
+        }
+
+    parameters = {**vars(args), "database_url": make_url(args.database_url).render_as_string(hide_password=True)}
+    data = build_results("post_payload", parameters, results)
+    print(f"{args.page_size}-row page, {args.content_size}-byte content, {engine.dialect.name}")
+    print_results(data)
+    for name, result in results.items():
+        print(f"{name}: {result['bytes_per_page'] / 1024:.1f} KiB/page")
+    if args.output:
+        write_results(args.output, data)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark the get_posts query variants and show their query plans.
+
+Run with:
+    python -m benchmarks.bench_post_queries --posts 100000 --output post_queries.json
+    python -m benchmarks.bench_post_queries --posts 100000 --without-indexes
+"""
+import argparse
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from benchmarks.results import build_results, print_results, write_results
+from benchmarks.seed import DEFAULT_DATABASE_URL, seed_database
+from benchmarks.timing import bench
+from src.pagination import PaginationParams, encode_cursor
+from src.posts import models
+from src.posts.service import build_posts_query, paginate_posts_query
+
+LISTING_INDEXES = ["ix_posts_author_id_created_at_id", "ix_posts_published_created_at_id"]
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN wrapper around a select statement."""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    prefix = "EXPLAIN QUERY PLAN " if compiler.dialect.name == "sqlite" else "EXPLAIN "
+    return prefix + compiler.process(element.statement, **kw)
+
+
+def explain(conn: Connection, statement) -> list[str]:
+    """Get the query plan as lines of text."""
+    rows = conn.execute(Explain(statement)).all()
+    return [str(row[-1]) for row in rows]
+
+
+def build_variants(conn: Connection, page_size: int, deep_page: int) -> dict:
+    """Build the statements issued by get_posts for each listing variant."""
+    feed = build_posts_query(published_only=True)
+    author_id = conn.scalar(select(models.Post.author_id).limit(1))
+    by_author = build_posts_query(author_id=author_id)
+
+    # Keyset cursor pointing at the same position as the deep offset page
+    deep_offset = (deep_page - 1) * page_size
+    position = conn.execute(
+        feed.with_only_columns(models.Post.created_at, models.Post.id)
+        .order_by(models.Post.created_at.desc(), models.Post.id.desc())
+        .offset(deep_offset - 1)
+        .limit(1)
+    ).first()
+    cursor = encode_cursor(*position) if position else None
+
+    return {
+        "feed page 1 (offset)": paginate_posts_query(feed, PaginationParams(page_size=page_size)),
+        f"feed page {deep_page} (offset)": paginate_posts_query(
+            feed, PaginationParams(page=deep_page, page_size=page_size)
+        ),
+        f"feed page {deep_page} (cursor)": paginate_posts_query(
+            feed, PaginationParams(page_size=page_size, cursor=cursor)
+        ),
+        "feed count": select(func.count()).select_from(feed.subquery()),
+        "author page 1 (offset)": paginate_posts_query(by_author, PaginationParams(page_size=page_size)),
+        "author count": select(func.count()).select_from(by_author.subquery()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark post listing queries.")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--posts", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--deep-page", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse an already seeded database")
+    parser.add_argument("--without-indexes", action="store_true", help="Drop the listing indexes first")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if not args.skip_seed:
+        seed_database(engine, users=args.users, posts=args.posts)
+
+    with engine.begin() as conn:
+        if args.without_indexes:
+            for index_name in LISTING_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+        conn.execute(text("ANALYZE"))
+
+    results = {}
+    with engine.connect() as conn:
+        variants = build_variants(conn, args.page_size, args.deep_page)
+        print(f"{engine.dialect.name}, {args.posts} posts, indexes {'dropped' if args.without_indexes else 'present'}")
+        for name, statement in variants.items():
+            results[name] = bench(lambda: conn.execute(statement).all(), args.repeat)
+            print(f"\n{name}: {results[name]['p50_ms']:.3f} ms (median of {args.repeat})")
+            for line in explain(conn, statement):
+                print(f"    {line}")
+
+    parameters = {**vars(args), "database_url": make_url(args.database_url).render_as_string(hide_password=True)}
+    data = build_results("post_queries", parameters, results)
+    print()
+    print_results(data)
+    if args.output:
+        write_results(args.output, data)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
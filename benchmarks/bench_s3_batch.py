@@ -0,0 +1,114 @@
+"""Benchmark batched S3 operations against their one-at-a-time equivalents.
+
+Uses moto's in-process S3 fake. --latency-ms adds a simulated round trip to
+every API call, which is what parallel uploads and DeleteObjects save on real S3.
+Batched operations run in --batch-size chunks, and their percentiles are per batch
+call; the per-object mean and rate are printed after the table.
+
+Run with:
+    python -m benchmarks.bench_s3_batch --output s3_batch.json
+"""
+import argparse
+import io
+import os
+import time
+from moto import mock_s3
+from benchmarks.results import build_results, print_results, summarize, write_results
+from benchmarks.timing import bench
+from src.aws.client import S3Client, S3UploadItem
+from src.aws.constants import DEFAULT_BUCKET_NAME
+
+
+def bench_each(func, keys: list[str]) -> dict:
+    """Time func called once per key."""
+    remaining = iter(keys)
+    return bench(lambda: func(next(remaining)), len(keys), warmup=0)
+
+
+def bench_batch(func, batches: list[list]) -> dict:
+    """
+    Time func called once per batch. Percentiles are per batch call; item_mean_ms and
+    item_throughput_rps give the per-object figures that compare with bench_each.
+    """
+    durations = []
+    started_at = time.perf_counter()
+    for batch in batches:
+        call_started_at = time.perf_counter()
+        func(batch)
+        durations.append(time.perf_counter() - call_started_at)
+    elapsed = time.perf_counter() - started_at
+    items = sum(len(batch) for batch in batches)
+    result = summarize(durations, elapsed)
+    result["item_mean_ms"] = round(elapsed / items * 1000, 4) if items else 0.0
+    result["item_throughput_rps"] = round(items / elapsed, 2) if elapsed > 0 else 0.0
+    return result
+
+
+def split(items: list, size: int) -> list[list]:
+    """Split items into consecutive batches of at most size."""
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def put_objects(client: S3Client, keys: list[str]) -> None:
+    """Create one small object per key."""
+    client.upload_files([S3UploadItem(io.BytesIO(b"x"), key) for key in keys])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=500)
+    parser.add_argument("--upload-size", type=int, default=64 * 1024)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+    results = {}
+    with mock_s3():
+        client = S3Client()
+        client.s3_client.create_bucket(Bucket=DEFAULT_BUCKET_NAME)
+        if args.latency_ms:
+            latency = args.latency_ms / 1000
+            client.s3_client.meta.events.register("before-call.s3", lambda **kwargs: time.sleep(latency))
+        keys = [f"bench/{i}.bin" for i in range(args.objects)]
+        payload = b"x" * args.upload_size
+
+        results["upload one at a time"] = bench_each(
+            lambda key: client.upload_file(io.BytesIO(payload), key), keys
+        )
+        key_batches = split(keys, args.batch_size)
+        item_batches = split([S3UploadItem(io.BytesIO(payload), key) for key in keys], args.batch_size)
+        results["upload batched"] = bench_batch(
+            lambda items: client.upload_files(items, max_concurrency=args.concurrency), item_batches
+        )
+
+        put_objects(client, keys)
+        results["delete one at a time"] = bench_each(client.delete_file, keys)
+        put_objects(client, keys)
+        results["delete batched"] = bench_batch(client.delete_files, key_batches)
+
+        client.presigned_url_cache.clear()
+        results["presign one at a time"] = bench_each(client.generate_presigned_url, keys)
+        client.presigned_url_cache.clear()
+        results["presign batched"] = bench_batch(client.generate_presigned_urls, key_batches)
+
+        # Every URL is cached by the batch run above
+        results["presign cached"] = bench_each(client.generate_presigned_url, keys)
+
+    data = build_results("s3_batch", vars(args), results)
+    print_results(data)
+    print("\nBatched rows time one call per batch; per object:")
+    for name, result in results.items():
+        if "item_mean_ms" in result:
+            print(f"{name:<50} {result['item_mean_ms']:>9.3f} ms {result['item_throughput_rps']:>10.1f} objects/s")
+    if args.output:
+        write_results(args.output, data)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark serializing a page of posts through FastAPI vs. the direct serializer.
+
+Run with:
+    python -m benchmarks.bench_serialization --output serialization.json
+"""
+import argparse
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from benchmarks.results import build_results, print_results, write_results
+from benchmarks.timing import bench
+from src.pagination import PaginatedResponse
+from src.posts import schemas
+from src.posts.service import PostListPage, serialize_posts_page
+
+
+def make_rows(count: int) -> list[SimpleNamespace]:
+    """Build rows shaped like the listing query results."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        SimpleNamespace(
+            id=i,
+            title=f"Benchmark post {i}",
+            status="published",
+            is_published=True,
+            author_id=i % 50 + 1,
+            created_at=start + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+def validated_path(rows: list, field, loop: asyncio.AbstractEventLoop) -> bytes:
+    """Previous path: validate each item, then let FastAPI validate and encode the page."""
+    page = PaginatedResponse.create(
+        items=[schemas.PostListResponse.model_validate(row) for row in rows],
+        total=10000,
+        page=1,
+        page_size=len(rows)
+    )
+    content = loop.run_until_complete(serialize_response(field=field, response_content=page))
+    return json.dumps(content, separators=(",", ":")).encode("utf-8")
+
+
+def direct_path(rows: list) -> bytes:
+    """Current path: validate row dicts in one pass and serialize straight to bytes."""
+    page = PostListPage.create(
+        items=[vars(row) for row in rows],
+        total=10000,
+        page=1,
+        page_size=len(rows)
+    )
+    return serialize_posts_page(page)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark post page serialization.")
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    rows = make_rows(args.items)
+    field = create_response_field(name="response", type_=PaginatedResponse[schemas.PostListResponse])
+    # One loop for every call, so event loop setup isn't measured as serialization
+    loop = asyncio.new_event_loop()
+    try:
+        assert json.loads(validated_path(rows, field, loop)) == json.loads(direct_path(rows))
+        results = {
+            f"{args.items}-item page validated + FastAPI encode": bench(
+                lambda: validated_path(rows, field, loop), args.iterations
+            ),
+            f"{args.items}-item page direct serializer": bench(lambda: direct_path(rows), args.iterations),
+        }
+    finally:
+        loop.close()
+
+    data = build_results("serialization", vars(args), results)
+    print_results(data)
+    validated, direct = (result["mean_ms"] for result in results.values())
+    print(f"\ndirect serializer speedup: {validated / direct:.1f}x")
+    if args.output:
+        write_results(args.output, data)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""In-process load generator for the auth and posts endpoints.
+
+Requests go straight to the ASGI app through httpx, so results exclude network and
+server overhead but include every middleware, dependency and database round trip.
+Each endpoint is driven separately by a fixed number of concurrent clients.
+
+Run with:
+    python -m benchmarks.load --posts 10000 --concurrency 32 --output load.json
+    python -m benchmarks.load --endpoints "GET /api/v1/posts/,GET /api/v1/auth/me"
+    python -m benchmarks.results load-before.json load.json
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+from typing import Awaitable, Callable
+import httpx
+from benchmarks import DEFAULT_DATABASE_URL
+from benchmarks.results import build_results, print_results, write_results
+from benchmarks.timing import bench_async
+
+# Login runs bcrypt on every request, so it gets fewer requests than the other endpoints
+LOGIN_ENDPOINT = "POST /api/v1/auth/login"
+
+# Seeded users logged in up front, whose tokens the authenticated endpoints rotate through
+TOKEN_USERS = 10
+
+# httpx logs every request at INFO, which would be measured as the app's logging cost
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+class LoadContext:
+    """Client and seeded data shared by the scenarios."""
+
+    def __init__(self, client: httpx.AsyncClient, password: str, users: int, posts: int, seed: int):
+        self.client = client
+        self.password = password
+        self.users = users
+        self.posts = posts
+        self.rng = random.Random(seed)
+        self.tokens: list[str] = []
+
+    def random_user_id(self) -> int:
+        """Pick a seeded user."""
+        return self.rng.randint(1, self.users)
+
+    def auth_headers(self) -> dict:
+        """Get headers authenticating as one of the logged-in users."""
+        return {"Authorization": f"Bearer {self.rng.choice(self.tokens)}"}
+
+
+async def login(context: LoadContext) -> httpx.Response:
+    """Log in a random seeded user."""
+    return await context.client.post(
+        "/api/v1/auth/login",
+        json={"email": f"bench{context.random_user_id()}@example.com", "password": context.password}
+    )
+
+
+async def create_post(context: LoadContext) -> httpx.Response:
+    """Create a post as one of the logged-in users."""
+    return await context.client.post(
+        "/api/v1/posts/",
+        json={"title": "Load test post", "content": "lorem ipsum " * 100, "status": "published"},
+        headers=context.auth_headers()
+    )
+
+
+# Endpoint name -> request maker
+SCENARIOS: dict[str, Callable[[LoadContext], Awaitable[httpx.Response]]] = {
+    "GET /health": lambda context: context.client.get("/health"),
+    LOGIN_ENDPOINT: login,
+    "GET /api/v1/auth/me": lambda context: context.client.get(
+        "/api/v1/auth/me", headers=context.auth_headers()
+    ),
+    "GET /api/v1/posts/": lambda context: context.client.get("/api/v1/posts/"),
+    "GET /api/v1/posts/?published_only=false": lambda context: context.client.get(
+        "/api/v1/posts/", params={"published_only": "false"}
+    ),
+    "GET /api/v1/posts/{post_id}": lambda context: context.client.get(
+        f"/api/v1/posts/{context.rng.randint(1, context.posts)}"
+    ),
+    "GET /api/v1/posts/me": lambda context: context.client.get(
+        "/api/v1/posts/me", headers=context.auth_headers()
+    ),
+    "POST /api/v1/posts/": create_post,
+}
+
+
+async def run_scenario(
+    context: LoadContext,
+    make_request: Callable[[LoadContext], Awaitable[httpx.Response]],
+    requests: int,
+    concurrency: int
+) -> dict:
+    """Send requests from concurrent clients, timing each one; error responses aren't timed."""
+    return await bench_async(
+        lambda: make_request(context),
+        requests,
+        concurrency=concurrency,
+        warmup=0,
+        failed=lambda response: response.status_code >= 400,
+        errors=(httpx.HTTPError,)
+    )
+
+
+async def run_load(args: argparse.Namespace, endpoints: list[str]) -> dict:
+    """Drive each endpoint in turn against the app, inside its lifespan."""
+    from benchmarks.seed import SEED_PASSWORD
+    from src.main import app
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            context = LoadContext(client, SEED_PASSWORD, args.users, args.posts, args.seed)
+            for user_id in range(1, min(TOKEN_USERS, args.users) + 1):
+                response = await client.post(
+                    "/api/v1/auth/login",
+                    json={"email": f"bench{user_id}@example.com", "password": context.password}
+                )
+                response.raise_for_status()
+                context.tokens.append(response.json()["access_token"])
+
+            for endpoint in endpoints:
+                requests = args.login_requests if endpoint == LOGIN_ENDPOINT else args.requests
+                await run_scenario(context, SCENARIOS[endpoint], min(args.warmup, requests), args.concurrency)
+                results[endpoint] = await run_scenario(context, SCENARIOS[endpoint], requests, args.concurrency)
+                print(f"  {endpoint}: {results[endpoint]['throughput_rps']:.1f} req/s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the auth and posts endpoints in process.")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse a database seeded by a previous run")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per endpoint")
+    parser.add_argument("--login-requests", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=50, help="Untimed requests per endpoint")
+    parser.add_argument("--endpoints", default=",".join(SCENARIOS), help="Comma-separated subset to run")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    endpoints = [endpoint.strip() for endpoint in args.endpoints.split(",") if endpoint.strip()]
+    unknown = [endpoint for endpoint in endpoints if endpoint not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown endpoints {unknown}; choose from {list(SCENARIOS)}")
+
+    # Settings are read when src is first imported, so point the app at the
+    # benchmark database before importing anything from it
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    os.environ.setdefault("DB_WARMUP_CONNECTIONS", "0")
+    # Access logs would flood the console; bench_logging measures their cost
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import make_url
+    from benchmarks import seed as seed_module
+    from src.auth.utils import get_password_hash
+
+    if not args.skip_seed:
+        seed_module.seed_database(
+            create_engine(args.database_url),
+            users=args.users,
+            posts=args.posts,
+            seed=args.seed,
+            password_hash=get_password_hash(seed_module.SEED_PASSWORD)
+        )
+
+    print(f"Load testing {len(endpoints)} endpoints with {args.concurrency} concurrent clients")
+    results = asyncio.run(run_load(args, endpoints))
+
+    parameters = {**vars(args), "database_url": make_url(args.database_url).render_as_string(hide_password=True)}
+    data = build_results("load", parameters, results)
+    print()
+    print_results(data)
+    if args.output:
+        write_results(args.output, data)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
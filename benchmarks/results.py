@@ -0,0 +1,178 @@
+"""JSON results format shared by the benchmarks, for comparing runs.
+
+Show a results file, or compare two runs (positive change is an improvement):
+    python -m benchmarks.results before.json
+    python -m benchmarks.results before.json after.json --fail-below 10
+
+A results file looks like:
+    {
+        "version": 1,
+        "suite": "load",
+        "created_at": "2024-01-01T00:00:00+00:00",
+        "environment": {"python": "3.11.6", "platform": "...", "git_commit": "..."},
+        "parameters": {"posts": 10000, "concurrency": 32},
+        "results": {
+            "GET /api/v1/posts/": {"count": 2000, "errors": 0, "throughput_rps": 812.4,
+                                   "mean_ms": 39.1, "p50_ms": 38.2, "p95_ms": 51.0, "p99_ms": 60.3, ...}
+        }
+    }
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
+RESULTS_VERSION = 1
+
+# Metrics where a higher value is the improvement
+HIGHER_IS_BETTER = {"throughput_rps"}
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """Get a percentile of sorted samples by linear interpolation."""
+    if not sorted_samples:
+        return 0.0
+    rank = (len(sorted_samples) - 1) * pct / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    weight = rank - lower
+    return sorted_samples[lower] * (1 - weight) + sorted_samples[upper] * weight
+
+
+def summarize(durations: list[float], elapsed: float, errors: int = 0) -> dict:
+    """Summarize per-operation durations in seconds, measured over elapsed wall time."""
+    samples = sorted(duration * 1000 for duration in durations)
+    count = len(samples)
+    return {
+        "count": count,
+        "errors": errors,
+        "elapsed_seconds": round(elapsed, 4),
+        "throughput_rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(samples) / count, 4) if count else 0.0,
+        "min_ms": round(samples[0], 4) if count else 0.0,
+        "p50_ms": round(percentile(samples, 50), 4),
+        "p95_ms": round(percentile(samples, 95), 4),
+        "p99_ms": round(percentile(samples, 99), 4),
+        "max_ms": round(samples[-1], 4) if count else 0.0,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """Get the current commit, if running from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def build_results(suite: str, parameters: dict, results: dict) -> dict:
+    """Wrap results with the environment they were measured in."""
+    return {
+        "version": RESULTS_VERSION,
+        "suite": suite,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": _cpu_count(),
+            "git_commit": _git_commit(),
+        },
+        "parameters": parameters,
+        "results": results,
+    }
+
+
+def _cpu_count() -> Optional[int]:
+    """Get the CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count()
+
+
+def write_results(path: str, data: dict) -> None:
+    """Write a results file."""
+    with open(path, "w") as results_file:
+        json.dump(data, results_file, indent=2)
+        results_file.write("\n")
+
+
+def load_results(path: str) -> dict:
+    """Read a results file."""
+    with open(path) as results_file:
+        data = json.load(results_file)
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path}: unsupported results version {data.get('version')!r}")
+    return data
+
+
+def print_results(data: dict) -> None:
+    """Print a results table."""
+    print(f"{'benchmark':<50} {'count':>7} {'err':>5} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, result in data["results"].items():
+        print(
+            f"{name:<50} {result['count']:>7} {result['errors']:>5} {result['throughput_rps']:>10.1f} "
+            f"{result['p50_ms']:>9.3f} {result['p95_ms']:>9.3f} {result['p99_ms']:>9.3f}"
+        )
+
+
+def compare_results(baseline: dict, current: dict, metrics: tuple[str, ...]) -> list[dict]:
+    """
+    Compare the benchmarks present in both runs.
+    change_pct is positive when the current run is better, whichever direction that is.
+    """
+    rows = []
+    for name, current_result in current["results"].items():
+        baseline_result = baseline["results"].get(name)
+        if baseline_result is None:
+            continue
+        for metric in metrics:
+            before, after = baseline_result.get(metric), current_result.get(metric)
+            if not before or after is None:
+                continue
+            if metric in HIGHER_IS_BETTER:
+                change = (after - before) / before * 100
+            else:
+                change = (before - after) / before * 100
+            rows.append({
+                "benchmark": name, "metric": metric, "baseline": before, "current": after, "change_pct": change
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show or compare benchmark results files.")
+    parser.add_argument("baseline")
+    parser.add_argument("current", nargs="?")
+    parser.add_argument("--metrics", default="throughput_rps,p50_ms,p95_ms,p99_ms")
+    parser.add_argument("--fail-below", type=float, help="Exit 1 if any metric regresses by more than this percent")
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline)
+    if args.current is None:
+        print_results(baseline)
+        return
+
+    current = load_results(args.current)
+    rows = compare_results(baseline, current, tuple(args.metrics.split(",")))
+    print(f"{'benchmark':<50} {'metric':<15} {'baseline':>11} {'current':>11} {'change':>9}")
+    for row in rows:
+        print(
+            f"{row['benchmark']:<50} {row['metric']:<15} {row['baseline']:>11.3f} "
+            f"{row['current']:>11.3f} {row['change_pct']:>+8.1f}%"
+        )
+
+    if args.fail_below is not None and any(row["change_pct"] < -args.fail_below for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
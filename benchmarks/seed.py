@@ -0,0 +1,94 @@
+"""Seeded dataset generator for benchmarks.
+
+Run with:
+    python -m benchmarks.seed --database-url sqlite:///bench.db --users 100 --posts 100000
+"""
+import argparse
+import random
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from benchmarks import DEFAULT_DATABASE_URL
+from src.database import Base
+from src.auth.models import User
+from src.posts.models import Post
+from src.posts.constants import POST_STATUS_DRAFT, POST_STATUS_PUBLISHED, POST_STATUS_ARCHIVED
+
+# Share of posts per status
+STATUS_WEIGHTS = {
+    POST_STATUS_PUBLISHED: 0.6,
+    POST_STATUS_DRAFT: 0.3,
+    POST_STATUS_ARCHIVED: 0.1,
+}
+
+# Not a real bcrypt hash; pass a real one as password_hash to log seeded users in
+SEED_PASSWORD_HASH = "$2b$12$" + "x" * 53
+SEED_PASSWORD = "benchmark-password"
+
+
+def seed_database(
+    engine: Engine,
+    users: int = 100,
+    posts: int = 10000,
+    content_size: int = 2000,
+    seed: int = 42,
+    batch_size: int = 5000,
+    password_hash: str = SEED_PASSWORD_HASH
+) -> None:
+    """Recreate the schema and fill it with deterministic users and posts."""
+    rng = random.Random(seed)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    statuses = list(STATUS_WEIGHTS)
+    weights = list(STATUS_WEIGHTS.values())
+    content = "lorem ipsum " * (content_size // 12 + 1)
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {
+                "id": user_id,
+                "email": f"bench{user_id}@example.com",
+                "username": f"bench{user_id}",
+                "hashed_password": password_hash,
+                "is_active": True,
+                "is_superuser": False,
+                "created_at": start,
+            }
+            for user_id in range(1, users + 1)
+        ])
+
+        for offset in range(0, posts, batch_size):
+            rows = []
+            for post_id in range(offset + 1, min(offset + batch_size, posts) + 1):
+                status = rng.choices(statuses, weights)[0]
+                rows.append({
+                    "id": post_id,
+                    "title": f"Benchmark post {post_id}",
+                    "content": content[:content_size],
+                    "status": status,
+                    "is_published": status == POST_STATUS_PUBLISHED,
+                    "author_id": rng.randint(1, users),
+                    # Whole seconds with occasional ties, like CURRENT_TIMESTAMP defaults
+                    "created_at": start + timedelta(seconds=post_id * 30 + rng.randint(0, 1) * 30),
+                })
+            conn.execute(insert(Post), rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed a benchmark database.")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--content-size", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    seed_database(engine, args.users, args.posts, args.content_size, args.seed)
+    print(f"Seeded {args.users} users and {args.posts} posts into {args.database_url}")
+
+
+if __name__ == "__main__":
+    main()
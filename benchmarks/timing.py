@@ -0,0 +1,57 @@
+"""Timing helpers shared by the benchmarks; results come back in the summarize format."""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+from benchmarks.results import summarize
+
+
+def bench(func: Callable, iterations: int, warmup: int = 1) -> dict:
+    """Time each call of a function, after some untimed warmup calls."""
+    for _ in range(warmup):
+        func()
+    durations = []
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        call_started_at = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - call_started_at)
+    return summarize(durations, time.perf_counter() - started_at)
+
+
+async def bench_async(
+    func: Callable[[], Awaitable],
+    iterations: int,
+    concurrency: int = 1,
+    warmup: int = 1,
+    failed: Optional[Callable[[Any], bool]] = None,
+    errors: tuple[type[BaseException], ...] = ()
+) -> dict:
+    """
+    Time each await of a coroutine function, from concurrent loops sharing the iterations.
+    Calls raising one of errors, or whose result failed() accepts, count as errors
+    and are left out of the timings.
+    """
+    for _ in range(warmup):
+        await func()
+    durations: list[float] = []
+    error_count = 0
+    remaining = iterations
+
+    async def loop():
+        nonlocal remaining, error_count
+        while remaining > 0:
+            remaining -= 1
+            call_started_at = time.perf_counter()
+            try:
+                result = await func()
+                is_error = failed is not None and failed(result)
+            except errors:
+                is_error = True
+            if is_error:
+                error_count += 1
+            else:
+                durations.append(time.perf_counter() - call_started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(loop() for _ in range(max(1, min(concurrency, iterations)))))
+    return summarize(durations, time.perf_counter() - started_at, error_count)
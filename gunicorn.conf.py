@@ -0,0 +1,50 @@
+"""Gunicorn configuration for production.
+
+Run with:
+    gunicorn src.main:app -c gunicorn.conf.py
+
+Every setting can be overridden from the environment or the command line.
+"""
+import os
+
+
+def _cpu_count() -> int:
+    """CPUs this process may run on, which respects container CPU sets."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Async workers keep a core busy on their own, so one per CPU rather than 2n+1
+workers = int(os.getenv("WEB_CONCURRENCY", _cpu_count()))
+worker_class = "src.workers.UvicornWorker"
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+backlog = int(os.getenv("GUNICORN_BACKLOG", 2048))
+
+# Import the app once in the master so workers share its memory copy-on-write
+preload_app = True
+
+# Longer than a typical load balancer idle timeout (60s), so the LB closes first
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 75))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+
+# Recycle workers periodically, staggered so they don't all restart together
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 10000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 1000))
+
+# Heartbeat files on tmpfs, so a slow disk can't make the arbiter kill workers
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Access records come from the app's AccessLogMiddleware, through its logging queue
+accesslog = os.getenv("GUNICORN_ACCESS_LOG")
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    """Give each worker its own connection pools and logging thread instead of the master's."""
+    from src.database import dispose_engines_after_fork
+    from src.logging_config import restart_logging_after_fork
+    dispose_engines_after_fork()
+    restart_logging_after_fork()
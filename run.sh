@@ -1,5 +1,6 @@
 #!/bin/bash
 # Run script for FastAPI application
+# Usage: ./run.sh [dev|prod]
 
 # Activate virtual environment if it exists
 if [ -d "venv" ]; then
@@ -7,5 +8,8 @@ if [ -d "venv" ]; then
 fi
 
 # Run the application
-uvicorn src.main:app --reload --host 0.0.0.0 --port 8000
-
+if [ "$1" = "prod" ]; then
+    exec gunicorn src.main:app -c gunicorn.conf.py
+else
+    uvicorn src.main:app --reload --no-access-log --host 0.0.0.0 --port 8000
+fi
@@ -5,8 +5,16 @@ from src.config import settings
 JWT_SECRET_KEY = settings.SECRET_KEY
 JWT_ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+JWT_DECODE_CACHE_ENABLED = settings.JWT_DECODE_CACHE_ENABLED
+JWT_DECODE_CACHE_MAX_SIZE = settings.JWT_DECODE_CACHE_MAX_SIZE
+JWT_DECODE_CACHE_TTL_SECONDS = settings.JWT_DECODE_CACHE_TTL_SECONDS
 
 # Password settings
 PASSWORD_MIN_LENGTH = 12
 PASSWORD_HASH_ALGORITHM = "bcrypt"
+PASSWORD_HASH_WORKERS = settings.PASSWORD_HASH_WORKERS
+PASSWORD_HASH_MAX_QUEUE = settings.PASSWORD_HASH_MAX_QUEUE
 
+# Authenticated user cache settings
+USER_CACHE_TTL_SECONDS = settings.USER_CACHE_TTL_SECONDS
+USER_CACHE_MAX_SIZE = settings.USER_CACHE_MAX_SIZE
@@ -22,4 +22,5 @@ ERROR_USER_ALREADY_EXISTS = "User already exists"
 ERROR_INVALID_TOKEN = "Invalid token"
 ERROR_TOKEN_EXPIRED = "Token has expired"
 ERROR_INSUFFICIENT_PERMISSIONS = "Insufficient permissions"
+ERROR_PASSWORD_HASHER_BUSY = "Authentication service is busy, please retry"
 
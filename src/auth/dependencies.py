@@ -2,8 +2,8 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from src.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database import get_async_db
 from src.auth import schemas, service, exceptions
 from src.auth.utils import decode_access_token
 
@@ -12,12 +12,17 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> schemas.UserResponse:
-    """Get current authenticated user."""
+    """
+    Get current authenticated user.
+    Cache misses read the primary, since a lagging replica could re-cache a user
+    right after invalidate_user_cache dropped them.
+    """
     try:
         payload = decode_access_token(token)
         email: str = payload.get("sub")
+        user_id: Optional[int] = payload.get("user_id")
         if email is None:
             raise exceptions.InvalidTokenError()
     except exceptions.InvalidTokenError:
@@ -27,7 +32,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = service.get_user_by_email(db, email)
+    user = await service.get_user_snapshot(db, email, user_id)
     if user is None:
         raise exceptions.UserNotFoundError()
     
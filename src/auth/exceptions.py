@@ -6,7 +6,8 @@ from src.auth.constants import (
     ERROR_USER_ALREADY_EXISTS,
     ERROR_INVALID_TOKEN,
     ERROR_TOKEN_EXPIRED,
-    ERROR_INSUFFICIENT_PERMISSIONS
+    ERROR_INSUFFICIENT_PERMISSIONS,
+    ERROR_PASSWORD_HASHER_BUSY
 )
 
 
@@ -45,3 +46,8 @@ class InsufficientPermissionsError(ForbiddenError):
     def __init__(self, message: str = ERROR_INSUFFICIENT_PERMISSIONS):
         super().__init__(message)
 
+
+class PasswordHasherBusyError(BaseAPIException):
+    """Password hashing pool saturated exception."""
+    def __init__(self, message: str = ERROR_PASSWORD_HASHER_BUSY):
+        super().__init__(message, status_code=503)
@@ -0,0 +1,111 @@
+"""Password hashing worker pool."""
+import asyncio
+import threading
+import time
+from typing import Callable
+from src.auth.config import PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE
+from src.auth.exceptions import PasswordHasherBusyError
+from src.auth.utils import get_password_hash, verify_password
+from src.executors import LazyThreadPool
+from src.metrics import (
+    PASSWORD_HASHER_QUEUE_WAIT_SECONDS,
+    PASSWORD_HASHER_REJECTED_TOTAL,
+    PASSWORD_HASHER_RUN_SECONDS
+)
+
+
+class PasswordHasher:
+    """
+    Run bcrypt hashing and verification off the event loop.
+    bcrypt releases the GIL while hashing, so a thread pool gives real parallelism
+    without the pickling and fork overhead of a process pool.
+    Requests beyond the worker count plus max_queue are rejected instead of queued.
+    """
+
+    def __init__(self, max_workers: int = PASSWORD_HASH_WORKERS, max_queue: int = PASSWORD_HASH_MAX_QUEUE):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = LazyThreadPool(max_workers, thread_name_prefix="password-hasher")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._queue_wait_seconds = 0.0
+        self._hash_seconds = 0.0
+        self._max_queue_wait_seconds = 0.0
+
+    def _record(self, operation: str, queue_wait: float, hash_time: float) -> None:
+        """Record timings for a finished job."""
+        PASSWORD_HASHER_QUEUE_WAIT_SECONDS.observe(queue_wait, operation=operation)
+        PASSWORD_HASHER_RUN_SECONDS.observe(hash_time, operation=operation)
+        with self._lock:
+            self._completed += 1
+            self._queue_wait_seconds += queue_wait
+            self._hash_seconds += hash_time
+            self._max_queue_wait_seconds = max(self._max_queue_wait_seconds, queue_wait)
+
+    async def _run(self, operation: str, func: Callable, *args):
+        """Run func in the pool, rejecting the call if the pool is saturated."""
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                PASSWORD_HASHER_REJECTED_TOTAL.inc()
+                raise PasswordHasherBusyError()
+            self._pending += 1
+
+        submitted_at = time.perf_counter()
+
+        def job():
+            started_at = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self._record(operation, started_at - submitted_at, time.perf_counter() - started_at)
+
+        try:
+            future = self._pool.get().submit(job)
+        except BaseException:
+            self._release()
+            raise
+        # Released when the job finishes, not when the caller stops waiting, since
+        # a cancelled request leaves its job running and occupying the pool
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        """Free a pending slot."""
+        with self._lock:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a password in the worker pool."""
+        return await self._run("hash", get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the worker pool."""
+        return await self._run("verify", verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        """Get pool counters and timings."""
+        with self._lock:
+            completed = self._completed
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "completed": completed,
+                "rejected": self._rejected,
+                "queue_wait_seconds_total": self._queue_wait_seconds,
+                "queue_wait_seconds_max": self._max_queue_wait_seconds,
+                "queue_wait_seconds_avg": self._queue_wait_seconds / completed if completed else 0.0,
+                "hash_seconds_total": self._hash_seconds,
+                "hash_seconds_avg": self._hash_seconds / completed if completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool."""
+        self._pool.shutdown()
+
+
+# Shared pool instance
+password_hasher = PasswordHasher()
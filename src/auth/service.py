@@ -1,62 +1,99 @@
 """Auth service layer."""
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.auth import models, schemas, exceptions
-from src.auth.utils import verify_password, get_password_hash, create_access_token
+from src.auth.hashing import password_hasher
+from src.auth.utils import create_access_token
 from datetime import timedelta
-from src.auth.config import ACCESS_TOKEN_EXPIRE_MINUTES
+from src.auth.config import ACCESS_TOKEN_EXPIRE_MINUTES, USER_CACHE_TTL_SECONDS, USER_CACHE_MAX_SIZE
+from src.cache import TTLCache
 
+# Snapshots of authenticated users keyed by user ID.
+# Invalidation is per process, so USER_CACHE_TTL_SECONDS bounds staleness across workers.
+user_cache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
 
-def get_user_by_id(db: Session, user_id: int) -> Optional[models.User]:
+
+async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[models.User]:
     """Get user by ID."""
-    return db.query(models.User).filter(models.User.id == user_id).first()
+    result = await db.execute(select(models.User).where(models.User.id == user_id))
+    return result.scalars().first()
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[models.User]:
     """Get user by email."""
-    return db.query(models.User).filter(models.User.email == email).first()
+    result = await db.execute(select(models.User).where(models.User.email == email))
+    return result.scalars().first()
 
 
-def get_user_by_username(db: Session, username: str) -> Optional[models.User]:
+async def get_user_by_username(db: AsyncSession, username: str) -> Optional[models.User]:
     """Get user by username."""
-    return db.query(models.User).filter(models.User.username == username).first()
+    result = await db.execute(select(models.User).where(models.User.username == username))
+    return result.scalars().first()
+
+
+async def get_user_snapshot(
+    db: AsyncSession,
+    email: str,
+    user_id: Optional[int] = None
+) -> Optional[schemas.UserResponse]:
+    """Get a cached user snapshot for the subject of an access token."""
+    if user_id is not None:
+        cached = user_cache.get(user_id)
+        if cached is not None and cached.email == email:
+            return cached
+        user = await get_user_by_id(db, user_id)
+    else:
+        user = await get_user_by_email(db, email)
+    
+    if user is None or user.email != email:
+        return None
+    
+    snapshot = schemas.UserResponse.model_validate(user)
+    user_cache.set(user.id, snapshot)
+    return snapshot
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """Drop a user's cached snapshot after it changes."""
+    user_cache.delete(user_id)
 
 
-def create_user(db: Session, user: schemas.UserCreate) -> models.User:
+async def create_user(db: AsyncSession, user: schemas.UserCreate) -> models.User:
     """Create a new user."""
     # Check if user already exists
-    if get_user_by_email(db, user.email):
+    if await get_user_by_email(db, user.email):
         raise exceptions.UserAlreadyExistsError()
     
-    if get_user_by_username(db, user.username):
+    if await get_user_by_username(db, user.username):
         raise exceptions.UserAlreadyExistsError("Username already exists")
     
     # Create new user
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await password_hasher.hash(user.password)
     db_user = models.User(
         email=user.email,
         username=user.username,
         hashed_password=hashed_password
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[models.User]:
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[models.User]:
     """Authenticate a user."""
-    user = get_user_by_email(db, email)
+    user = await get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await password_hasher.verify(password, user.hashed_password):
         return None
     return user
 
 
-def login_user(db: Session, login_data: schemas.LoginRequest) -> schemas.Token:
+async def login_user(db: AsyncSession, login_data: schemas.LoginRequest) -> schemas.Token:
     """Login a user and return access token."""
-    user = authenticate_user(db, login_data.email, login_data.password)
+    user = await authenticate_user(db, login_data.email, login_data.password)
     if not user:
         raise exceptions.InvalidCredentialsError()
     
@@ -71,3 +108,30 @@ def login_user(db: Session, login_data: schemas.LoginRequest) -> schemas.Token:
     
     return schemas.Token(access_token=access_token, token_type="bearer")
 
+
+async def update_user(db: AsyncSession, user_id: int, user_update: schemas.UserUpdate) -> models.User:
+    """Update a user."""
+    db_user = await get_user_by_id(db, user_id)
+    if not db_user:
+        raise exceptions.UserNotFoundError()
+    
+    if user_update.email is not None and user_update.email != db_user.email:
+        if await get_user_by_email(db, user_update.email):
+            raise exceptions.UserAlreadyExistsError()
+    
+    if user_update.username is not None and user_update.username != db_user.username:
+        if await get_user_by_username(db, user_update.username):
+            raise exceptions.UserAlreadyExistsError("Username already exists")
+    
+    for field, value in user_update.model_dump(exclude_unset=True, exclude_none=True).items():
+        setattr(db_user, field, value)
+    
+    await db.commit()
+    await db.refresh(db_user)
+    invalidate_user_cache(db_user.id)
+    return db_user
+
+
+async def deactivate_user(db: AsyncSession, user_id: int) -> models.User:
+    """Deactivate a user."""
+    return await update_user(db, user_id, schemas.UserUpdate(is_active=False))
@@ -1,11 +1,27 @@
 """Auth utility functions."""
 import hashlib
+import time
 import bcrypt
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from src.auth.config import JWT_SECRET_KEY, JWT_ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from src.auth.config import (
+    JWT_SECRET_KEY,
+    JWT_ALGORITHM,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    JWT_DECODE_CACHE_ENABLED,
+    JWT_DECODE_CACHE_MAX_SIZE,
+    JWT_DECODE_CACHE_TTL_SECONDS
+)
 from src.auth.exceptions import InvalidTokenError, TokenExpiredError
+from src.cache import TTLCache
+from src.metrics import AUTH_OPERATION_DURATION_SECONDS
+
+# Verified token claims keyed by SHA-256 digest of the token
+token_cache = TTLCache(
+    maxsize=JWT_DECODE_CACHE_MAX_SIZE,
+    ttl=JWT_DECODE_CACHE_TTL_SECONDS if JWT_DECODE_CACHE_ENABLED else 0
+)
 
 
 def _preprocess_password(password: str) -> bytes:
@@ -23,6 +39,7 @@ def _preprocess_password(password: str) -> bytes:
     return sha256_hash
 
 
+@AUTH_OPERATION_DURATION_SECONDS.time(operation="verify_password")
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash.
@@ -39,6 +56,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+@AUTH_OPERATION_DURATION_SECONDS.time(operation="get_password_hash")
 def get_password_hash(password: str) -> str:
     """
     Hash a password using SHA-256 + bcrypt.
@@ -71,13 +89,28 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+@AUTH_OPERATION_DURATION_SECONDS.time(operation="decode_access_token")
 def decode_access_token(token: str) -> dict:
-    """Decode and verify a JWT access token."""
+    """
+    Decode and verify a JWT access token.
+    Verified claims are cached until the token's exp, so repeated requests with
+    the same bearer token skip signature verification.
+    """
+    cache_key = hashlib.sha256(token.encode('utf-8')).digest()
+    payload = token_cache.get(cache_key)
+    if payload is not None:
+        return dict(payload)
+    
     try:
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-        return payload
     except jwt.ExpiredSignatureError:
         raise TokenExpiredError()
     except JWTError:
         raise InvalidTokenError()
+    
+    # Tokens without exp are never cached, since their lifetime is unbounded
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(cache_key, payload, ttl=min(exp - time.time(), token_cache.ttl))
+    return dict(payload)
 
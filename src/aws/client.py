@@ -1,11 +1,70 @@
 """AWS client for external service communication."""
-import boto3
-from typing import Optional, BinaryIO
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import AsyncIterator, Callable, Iterator, NamedTuple, Optional, BinaryIO
 from datetime import datetime, timedelta
-from botocore.exceptions import ClientError, BotoCoreError
-from src.aws.config import AWS_REGION, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_ENDPOINT_URL
-from src.aws.exceptions import AWSConnectionError, S3UploadError, S3DownloadError
-from src.aws.constants import DEFAULT_BUCKET_NAME
+from src.aws.config import (
+    AWS_REGION,
+    AWS_ACCESS_KEY_ID,
+    AWS_SECRET_ACCESS_KEY,
+    AWS_ENDPOINT_URL,
+    S3_MULTIPART_THRESHOLD,
+    S3_MULTIPART_CHUNKSIZE,
+    S3_TRANSFER_MAX_CONCURRENCY,
+    S3_DOWNLOAD_CHUNK_SIZE,
+    S3_MAX_POOL_CONNECTIONS,
+    S3_CONNECT_TIMEOUT_SECONDS,
+    S3_READ_TIMEOUT_SECONDS,
+    S3_MAX_ATTEMPTS,
+    S3_RETRY_MODE,
+    S3_TCP_KEEPALIVE,
+    S3_BATCH_MAX_CONCURRENCY,
+    PRESIGNED_URL_CACHE_MAX_SIZE,
+    PRESIGNED_URL_MIN_REMAINING_FRACTION
+)
+from src.aws.exceptions import (
+    AWSConnectionError,
+    S3UploadError,
+    S3DownloadError,
+    InvalidRangeError,
+    UploadNotFoundError
+)
+from src.aws.constants import DEFAULT_BUCKET_NAME, DELETE_OBJECTS_MAX_KEYS, UPLOAD_URL_EXPIRATION
+from src.aws.schemas import S3BatchItemResult, S3FileInfo, PresignedURLRequest, PresignedURLResponse
+from src.cache import TTLCache
+from src.executors import LazyThreadPool
+
+
+class S3ObjectStream:
+    """Streaming body of an S3 object, read in chunks instead of buffered whole."""
+    
+    def __init__(self, response: dict, chunk_size: int = S3_DOWNLOAD_CHUNK_SIZE):
+        self._body = response['Body']
+        self.chunk_size = chunk_size
+        self.content_length: Optional[int] = response.get('ContentLength')
+        self.content_type: Optional[str] = response.get('ContentType')
+        self.content_range: Optional[str] = response.get('ContentRange')
+        self.etag: Optional[str] = response.get('ETag')
+    
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the body in chunks, closing the connection when done or abandoned."""
+        try:
+            yield from self._body.iter_chunks(self.chunk_size)
+        finally:
+            self._body.close()
+    
+    def close(self) -> None:
+        """Release the underlying connection."""
+        self._body.close()
+
+
+class S3UploadItem(NamedTuple):
+    """A file to upload as part of a batch."""
+    file_obj: BinaryIO
+    file_key: str
+    content_type: Optional[str] = None
 
 
 class S3Client:
@@ -13,16 +72,39 @@ class S3Client:
     
     def __init__(self):
         """Initialize S3 client."""
+        # boto3 takes a noticeable share of app import time, so load it on first use
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config
+        
         try:
             self.s3_client = boto3.client(
                 's3',
                 region_name=AWS_REGION,
                 aws_access_key_id=AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-                endpoint_url=AWS_ENDPOINT_URL
+                endpoint_url=AWS_ENDPOINT_URL,
+                config=Config(
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    connect_timeout=S3_CONNECT_TIMEOUT_SECONDS,
+                    read_timeout=S3_READ_TIMEOUT_SECONDS,
+                    retries={'max_attempts': S3_MAX_ATTEMPTS, 'mode': S3_RETRY_MODE},
+                    tcp_keepalive=S3_TCP_KEEPALIVE,
+                )
             )
         except Exception as e:
             raise AWSConnectionError(f"Failed to initialize S3 client: {str(e)}")
+        
+        # Multipart uploads stream the file object in parts instead of reading it whole
+        self.transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+            max_concurrency=min(S3_TRANSFER_MAX_CONCURRENCY, S3_MAX_POOL_CONNECTIONS),
+        )
+        
+        # Presigned URLs keyed by (bucket, key, expiration); see _presign
+        self.presigned_url_cache = TTLCache(maxsize=PRESIGNED_URL_CACHE_MAX_SIZE, ttl=float("inf"))
+        self.presigned_url_min_remaining = PRESIGNED_URL_MIN_REMAINING_FRACTION
     
     def upload_file(
         self,
@@ -31,7 +113,12 @@ class S3Client:
         bucket_name: str = DEFAULT_BUCKET_NAME,
         content_type: Optional[str] = None
     ) -> str:
-        """Upload a file to S3."""
+        """
+        Upload a file to S3.
+        file_obj is read incrementally, so an UploadFile's SpooledTemporaryFile
+        is streamed to S3 without loading it into memory.
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
         try:
             extra_args = {}
             if content_type:
@@ -41,61 +128,397 @@ class S3Client:
                 file_obj,
                 bucket_name,
                 file_key,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Config=self.transfer_config
             )
             
-            # Return file URL
-            if AWS_ENDPOINT_URL:
-                file_url = f"{AWS_ENDPOINT_URL}/{bucket_name}/{file_key}"
-            else:
-                file_url = f"https://{bucket_name}.s3.{AWS_REGION}.amazonaws.com/{file_key}"
-            
-            return file_url
+            return self.get_file_url(file_key, bucket_name)
         except (ClientError, BotoCoreError) as e:
             raise S3UploadError(f"Failed to upload file: {str(e)}")
     
+    def get_file_url(self, file_key: str, bucket_name: str = DEFAULT_BUCKET_NAME) -> str:
+        """Get the URL of a file in S3."""
+        if AWS_ENDPOINT_URL:
+            return f"{AWS_ENDPOINT_URL}/{bucket_name}/{file_key}"
+        return f"https://{bucket_name}.s3.{AWS_REGION}.amazonaws.com/{file_key}"
+    
+    def generate_presigned_post(
+        self,
+        file_key: str,
+        content_type: str,
+        max_size: int,
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        expiration: int = UPLOAD_URL_EXPIRATION
+    ) -> dict:
+        """
+        Generate a presigned POST policy for uploading straight to S3.
+        S3 rejects uploads with another content type or more than max_size bytes.
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+        try:
+            return self.s3_client.generate_presigned_post(
+                bucket_name,
+                file_key,
+                Fields={'Content-Type': content_type},
+                Conditions=[
+                    {'Content-Type': content_type},
+                    ['content-length-range', 1, max_size],
+                ],
+                ExpiresIn=expiration
+            )
+        except (ClientError, BotoCoreError) as e:
+            raise S3UploadError(f"Failed to generate presigned POST: {str(e)}")
+    
+    def get_file_info(
+        self,
+        file_key: str,
+        bucket_name: str = DEFAULT_BUCKET_NAME
+    ) -> Optional[S3FileInfo]:
+        """Get file metadata from S3, or None if the file doesn't exist."""
+        from botocore.exceptions import BotoCoreError, ClientError
+        try:
+            response = self.s3_client.head_object(Bucket=bucket_name, Key=file_key)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise S3DownloadError(f"Failed to get file info: {str(e)}")
+        except BotoCoreError as e:
+            raise S3DownloadError(f"Failed to get file info: {str(e)}")
+        return S3FileInfo(
+            file_key=file_key,
+            bucket_name=bucket_name,
+            file_size=response.get('ContentLength'),
+            content_type=response.get('ContentType'),
+            last_modified=response.get('LastModified')
+        )
+    
     def download_file(
         self,
         file_key: str,
         bucket_name: str = DEFAULT_BUCKET_NAME
     ) -> bytes:
         """Download a file from S3."""
+        from botocore.exceptions import BotoCoreError, ClientError
         try:
             response = self.s3_client.get_object(Bucket=bucket_name, Key=file_key)
             return response['Body'].read()
         except (ClientError, BotoCoreError) as e:
             raise S3DownloadError(f"Failed to download file: {str(e)}")
     
+    def open_stream(
+        self,
+        file_key: str,
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        byte_range: Optional[str] = None,
+        chunk_size: int = S3_DOWNLOAD_CHUNK_SIZE
+    ) -> S3ObjectStream:
+        """
+        Open a file in S3 for chunked reading.
+        byte_range is an HTTP Range value such as "bytes=0-1023".
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+        try:
+            params = {'Bucket': bucket_name, 'Key': file_key}
+            if byte_range:
+                params['Range'] = byte_range
+            response = self.s3_client.get_object(**params)
+            return S3ObjectStream(response, chunk_size=chunk_size)
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code')
+            if code == 'InvalidRange':
+                raise InvalidRangeError()
+            if code in ('NoSuchKey', '404'):
+                raise UploadNotFoundError()
+            raise S3DownloadError(f"Failed to download file: {str(e)}")
+        except BotoCoreError as e:
+            raise S3DownloadError(f"Failed to download file: {str(e)}")
+    
     def delete_file(
         self,
         file_key: str,
         bucket_name: str = DEFAULT_BUCKET_NAME
     ) -> bool:
         """Delete a file from S3."""
+        from botocore.exceptions import BotoCoreError, ClientError
         try:
             self.s3_client.delete_object(Bucket=bucket_name, Key=file_key)
             return True
         except (ClientError, BotoCoreError) as e:
             raise S3DownloadError(f"Failed to delete file: {str(e)}")
     
-    def generate_presigned_url(
-        self,
-        file_key: str,
-        bucket_name: str = DEFAULT_BUCKET_NAME,
-        expiration: int = 3600
-    ) -> str:
-        """Generate a presigned URL for file access."""
+    def _presign(self, file_key: str, bucket_name: str, expiration: int) -> tuple[str, float]:
+        """
+        Get a presigned URL and its expiry time, reusing a cached URL while at
+        least presigned_url_min_remaining of its lifetime is left.
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+        cache_key = (bucket_name, file_key, expiration)
+        cached = self.presigned_url_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
+            signed_at = time.time()
             url = self.s3_client.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': bucket_name, 'Key': file_key},
                 ExpiresIn=expiration
             )
-            return url
         except (ClientError, BotoCoreError) as e:
             raise S3DownloadError(f"Failed to generate presigned URL: {str(e)}")
+        
+        entry = (url, signed_at + expiration)
+        self.presigned_url_cache.set(cache_key, entry, ttl=expiration * (1 - self.presigned_url_min_remaining))
+        return entry
+    
+    def generate_presigned_url(
+        self,
+        file_key: str,
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        expiration: int = 3600
+    ) -> str:
+        """Generate a presigned URL for file access."""
+        url, _ = self._presign(file_key, bucket_name, expiration)
+        return url
+    
+    def get_presigned_url(
+        self,
+        request: PresignedURLRequest,
+        bucket_name: str = DEFAULT_BUCKET_NAME
+    ) -> PresignedURLResponse:
+        """Get a presigned URL, with expires_in counting down for cached URLs."""
+        url, expires_at = self._presign(request.file_key, bucket_name, request.expiration)
+        return PresignedURLResponse(url=url, expires_in=max(0, int(expires_at - time.time())))
+    
+    def upload_item(self, item: S3UploadItem, bucket_name: str = DEFAULT_BUCKET_NAME) -> S3BatchItemResult:
+        """Upload one file of a batch, reporting failure instead of raising."""
+        try:
+            url = self.upload_file(item.file_obj, item.file_key, bucket_name, item.content_type)
+            return S3BatchItemResult(file_key=item.file_key, success=True, url=url)
+        except S3UploadError as e:
+            return S3BatchItemResult(file_key=item.file_key, success=False, error=e.message)
+    
+    def upload_files(
+        self,
+        items: list[S3UploadItem],
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        max_concurrency: int = S3_BATCH_MAX_CONCURRENCY
+    ) -> list[S3BatchItemResult]:
+        """
+        Upload several files in parallel.
+        Concurrency is capped at the connection pool size; one failed upload
+        does not stop the rest.
+        """
+        if not items:
+            return []
+        workers = max(1, min(max_concurrency, S3_MAX_POOL_CONNECTIONS, len(items)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-upload") as executor:
+            return list(executor.map(partial(self.upload_item, bucket_name=bucket_name), items))
+    
+    def delete_files(
+        self,
+        file_keys: list[str],
+        bucket_name: str = DEFAULT_BUCKET_NAME
+    ) -> list[S3BatchItemResult]:
+        """Delete several files with DeleteObjects, 1000 keys per request."""
+        from botocore.exceptions import BotoCoreError, ClientError
+        file_keys = list(dict.fromkeys(file_keys))
+        errors: dict[str, str] = {}
+        for start in range(0, len(file_keys), DELETE_OBJECTS_MAX_KEYS):
+            chunk = file_keys[start:start + DELETE_OBJECTS_MAX_KEYS]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in chunk], 'Quiet': True}
+                )
+            except (ClientError, BotoCoreError) as e:
+                errors.update((key, f"Failed to delete file: {str(e)}") for key in chunk)
+                continue
+            # Quiet mode only reports the keys that failed
+            for error in response.get('Errors', []):
+                errors[error['Key']] = f"Failed to delete file: {error.get('Code')}: {error.get('Message')}"
+        
+        return [
+            S3BatchItemResult(file_key=key, success=key not in errors, error=errors.get(key))
+            for key in file_keys
+        ]
+    
+    def generate_presigned_urls(
+        self,
+        file_keys: list[str],
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        expiration: int = 3600
+    ) -> list[S3BatchItemResult]:
+        """
+        Generate presigned URLs for several files.
+        Presigning is local signing with no network round trip, so a plain loop
+        is fastest; batching saves the per-call dispatch in async code.
+        """
+        results = []
+        for key in file_keys:
+            try:
+                url = self.generate_presigned_url(key, bucket_name, expiration)
+                results.append(S3BatchItemResult(file_key=key, success=True, url=url))
+            except S3DownloadError as e:
+                results.append(S3BatchItemResult(file_key=key, success=False, error=e.message))
+        return results
+
+
+class AsyncS3Client:
+    """
+    Async façade over S3Client.
+    boto3 calls run in a dedicated thread pool sized to the connection pool, so
+    async routes never block the event loop and never queue on connections.
+    """
+    
+    def __init__(self, client: S3Client, max_workers: int = S3_MAX_POOL_CONNECTIONS):
+        self.client = client
+        self.max_workers = max_workers
+        self._pool = LazyThreadPool(max_workers, thread_name_prefix="s3")
+    
+    async def _run(self, func: Callable, *args, **kwargs):
+        """Run a blocking S3Client call in the thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool.get(), partial(func, *args, **kwargs))
+    
+    async def upload_file(
+        self,
+        file_obj: BinaryIO,
+        file_key: str,
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        content_type: Optional[str] = None
+    ) -> str:
+        """Upload a file to S3."""
+        return await self._run(self.client.upload_file, file_obj, file_key, bucket_name, content_type)
+    
+    async def generate_presigned_post(
+        self,
+        file_key: str,
+        content_type: str,
+        max_size: int,
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        expiration: int = UPLOAD_URL_EXPIRATION
+    ) -> dict:
+        """Generate a presigned POST policy for uploading straight to S3."""
+        return await self._run(
+            self.client.generate_presigned_post, file_key, content_type, max_size, bucket_name, expiration
+        )
+    
+    async def get_file_info(
+        self,
+        file_key: str,
+        bucket_name: str = DEFAULT_BUCKET_NAME
+    ) -> Optional[S3FileInfo]:
+        """Get file metadata from S3."""
+        return await self._run(self.client.get_file_info, file_key, bucket_name)
+    
+    async def download_file(self, file_key: str, bucket_name: str = DEFAULT_BUCKET_NAME) -> bytes:
+        """Download a file from S3."""
+        return await self._run(self.client.download_file, file_key, bucket_name)
+    
+    async def open_stream(
+        self,
+        file_key: str,
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        byte_range: Optional[str] = None,
+        chunk_size: int = S3_DOWNLOAD_CHUNK_SIZE
+    ) -> S3ObjectStream:
+        """Open a file in S3 for chunked reading."""
+        return await self._run(self.client.open_stream, file_key, bucket_name, byte_range, chunk_size)
+    
+    async def iter_file(
+        self,
+        file_key: str,
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        byte_range: Optional[str] = None,
+        chunk_size: int = S3_DOWNLOAD_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Yield a file's chunks, reading each one in the thread pool."""
+        stream = await self.open_stream(file_key, bucket_name, byte_range, chunk_size)
+        async for chunk in self.iter_stream(stream):
+            yield chunk
+    
+    async def iter_stream(self, stream: S3ObjectStream) -> AsyncIterator[bytes]:
+        """Yield an open stream's chunks, reading each one in the thread pool."""
+        chunks = iter(stream)
+        try:
+            while True:
+                chunk = await self._run(next, chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            stream.close()
+    
+    async def delete_file(self, file_key: str, bucket_name: str = DEFAULT_BUCKET_NAME) -> bool:
+        """Delete a file from S3."""
+        return await self._run(self.client.delete_file, file_key, bucket_name)
+    
+    async def generate_presigned_url(
+        self,
+        file_key: str,
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        expiration: int = 3600
+    ) -> str:
+        """Generate a presigned URL for file access."""
+        return await self._run(self.client.generate_presigned_url, file_key, bucket_name, expiration)
+    
+    async def upload_files(
+        self,
+        items: list[S3UploadItem],
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        max_concurrency: int = S3_BATCH_MAX_CONCURRENCY
+    ) -> list[S3BatchItemResult]:
+        """
+        Upload several files in parallel on this client's thread pool.
+        The semaphore caps how many of them hold a pool thread at once.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def upload(item: S3UploadItem) -> S3BatchItemResult:
+            async with semaphore:
+                return await self._run(self.client.upload_item, item, bucket_name)
+        
+        return list(await asyncio.gather(*(upload(item) for item in items)))
+    
+    async def delete_files(
+        self,
+        file_keys: list[str],
+        bucket_name: str = DEFAULT_BUCKET_NAME
+    ) -> list[S3BatchItemResult]:
+        """Delete several files from S3."""
+        return await self._run(self.client.delete_files, file_keys, bucket_name)
+    
+    async def generate_presigned_urls(
+        self,
+        file_keys: list[str],
+        bucket_name: str = DEFAULT_BUCKET_NAME,
+        expiration: int = 3600
+    ) -> list[S3BatchItemResult]:
+        """Generate presigned URLs for several files."""
+        return await self._run(self.client.generate_presigned_urls, file_keys, bucket_name, expiration)
+    
+    async def get_presigned_url(
+        self,
+        request: PresignedURLRequest,
+        bucket_name: str = DEFAULT_BUCKET_NAME
+    ) -> PresignedURLResponse:
+        """Get a presigned URL for file access."""
+        return await self._run(self.client.get_presigned_url, request, bucket_name)
+    
+    def shutdown(self) -> None:
+        """Shut down the thread pool."""
+        self._pool.shutdown()
+
+
+@lru_cache(maxsize=None)
+def get_s3_client() -> S3Client:
+    """Get the shared S3 client, created on first use rather than at import."""
+    return S3Client()
 
 
-# Singleton instance
-s3_client = S3Client()
+@lru_cache(maxsize=None)
+def get_async_s3_client() -> AsyncS3Client:
+    """Get the shared async S3 client, created on first use rather than at import."""
+    return AsyncS3Client(get_s3_client())
 
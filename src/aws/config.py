@@ -7,5 +7,24 @@ AWS_ACCESS_KEY_ID = settings.AWS_ACCESS_KEY_ID
 AWS_SECRET_ACCESS_KEY = settings.AWS_SECRET_ACCESS_KEY
 
 # AWS Service endpoints (if using localstack or custom endpoints)
-AWS_ENDPOINT_URL = None  # e.g., "http://localhost:4566" for localstack
+AWS_ENDPOINT_URL = settings.AWS_ENDPOINT_URL  # e.g., "http://localhost:4566" for localstack
 
+# S3 transfer settings
+S3_MULTIPART_THRESHOLD = settings.S3_MULTIPART_THRESHOLD
+S3_MULTIPART_CHUNKSIZE = settings.S3_MULTIPART_CHUNKSIZE
+S3_TRANSFER_MAX_CONCURRENCY = settings.S3_TRANSFER_MAX_CONCURRENCY
+S3_DOWNLOAD_CHUNK_SIZE = settings.S3_DOWNLOAD_CHUNK_SIZE
+
+
+# S3 connection settings
+S3_MAX_POOL_CONNECTIONS = settings.S3_MAX_POOL_CONNECTIONS
+S3_CONNECT_TIMEOUT_SECONDS = settings.S3_CONNECT_TIMEOUT_SECONDS
+S3_READ_TIMEOUT_SECONDS = settings.S3_READ_TIMEOUT_SECONDS
+S3_MAX_ATTEMPTS = settings.S3_MAX_ATTEMPTS
+S3_RETRY_MODE = settings.S3_RETRY_MODE
+S3_TCP_KEEPALIVE = settings.S3_TCP_KEEPALIVE
+S3_BATCH_MAX_CONCURRENCY = settings.S3_BATCH_MAX_CONCURRENCY
+
+# Presigned URL cache
+PRESIGNED_URL_CACHE_MAX_SIZE = settings.PRESIGNED_URL_CACHE_MAX_SIZE
+PRESIGNED_URL_MIN_REMAINING_FRACTION = settings.PRESIGNED_URL_MIN_REMAINING_FRACTION
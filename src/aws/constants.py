@@ -6,6 +6,11 @@ DEFAULT_BUCKET_NAME = "default-bucket"
 # S3 settings
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 ALLOWED_FILE_TYPES = ["image/jpeg", "image/png", "image/gif", "application/pdf"]
+DELETE_OBJECTS_MAX_KEYS = 1000  # S3 DeleteObjects limit per request
+
+# Direct uploads
+UPLOAD_KEY_PREFIX = "uploads"
+UPLOAD_URL_EXPIRATION = 900  # seconds
 
 # Error messages
 ERROR_AWS_CONNECTION_FAILED = "Failed to connect to AWS service"
@@ -13,4 +18,7 @@ ERROR_S3_UPLOAD_FAILED = "Failed to upload file to S3"
 ERROR_S3_DOWNLOAD_FAILED = "Failed to download file from S3"
 ERROR_INVALID_FILE_TYPE = "Invalid file type"
 ERROR_FILE_TOO_LARGE = "File size exceeds maximum allowed size"
+ERROR_INVALID_RANGE = "Requested range not satisfiable"
+ERROR_UPLOAD_NOT_FOUND = "Uploaded file not found"
+ERROR_UNAUTHORIZED_FILE_ACCESS = "You don't have permission to access this file"
 
@@ -1,11 +1,14 @@
 """AWS module exceptions."""
-from src.exceptions import BaseAPIException
+from src.exceptions import BaseAPIException, NotFoundError, ForbiddenError
 from src.aws.constants import (
     ERROR_AWS_CONNECTION_FAILED,
     ERROR_S3_UPLOAD_FAILED,
     ERROR_S3_DOWNLOAD_FAILED,
     ERROR_INVALID_FILE_TYPE,
-    ERROR_FILE_TOO_LARGE
+    ERROR_FILE_TOO_LARGE,
+    ERROR_INVALID_RANGE,
+    ERROR_UPLOAD_NOT_FOUND,
+    ERROR_UNAUTHORIZED_FILE_ACCESS
 )
 
 
@@ -38,3 +41,20 @@ class FileTooLargeError(BaseAPIException):
     def __init__(self, message: str = ERROR_FILE_TOO_LARGE):
         super().__init__(message, status_code=400)
 
+
+class InvalidRangeError(BaseAPIException):
+    """Invalid byte range error."""
+    def __init__(self, message: str = ERROR_INVALID_RANGE):
+        super().__init__(message, status_code=416)
+
+
+class UploadNotFoundError(NotFoundError):
+    """Uploaded file not found error."""
+    def __init__(self, message: str = ERROR_UPLOAD_NOT_FOUND):
+        super().__init__(message)
+
+
+class UnauthorizedFileAccessError(ForbiddenError):
+    """Unauthorized file access error."""
+    def __init__(self, message: str = ERROR_UNAUTHORIZED_FILE_ACCESS):
+        super().__init__(message)
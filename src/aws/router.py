@@ -0,0 +1,97 @@
+"""File upload router endpoints."""
+from fastapi import APIRouter, Depends, Request, status
+from src.auth.dependencies import get_current_active_user
+from src.auth import schemas as auth_schemas
+from src.aws import schemas
+from src.aws.client import AsyncS3Client, get_async_s3_client
+from src.aws.constants import DEFAULT_BUCKET_NAME, UPLOAD_KEY_PREFIX, UPLOAD_URL_EXPIRATION
+from src.aws.exceptions import (
+    InvalidFileTypeError,
+    FileTooLargeError,
+    UploadNotFoundError,
+    UnauthorizedFileAccessError
+)
+from src.aws.utils import (
+    validate_file_type,
+    validate_file_size,
+    generate_file_key,
+    parse_range_header,
+    stream_response
+)
+
+router = APIRouter()
+
+
+def _user_prefix(user_id: int) -> str:
+    """Get the key prefix a user's uploads live under."""
+    return f"{UPLOAD_KEY_PREFIX}/{user_id}"
+
+
+@router.post("/uploads", response_model=schemas.PresignedUploadResponse, status_code=status.HTTP_201_CREATED)
+async def create_upload(
+    upload: schemas.PresignedUploadRequest,
+    current_user: auth_schemas.UserResponse = Depends(get_current_active_user),
+    s3: AsyncS3Client = Depends(get_async_s3_client)
+):
+    """
+    Issue a presigned POST so the client uploads straight to S3.
+    The file bytes never pass through the API; S3 enforces the content type and size.
+    """
+    validate_file_type(upload.content_type)
+    validate_file_size(upload.file_size)
+    file_key = generate_file_key(_user_prefix(current_user.id), upload.filename)
+    post = await s3.generate_presigned_post(file_key, upload.content_type, upload.file_size)
+    return schemas.PresignedUploadResponse(
+        url=post["url"],
+        fields=post["fields"],
+        file_key=file_key,
+        expires_in=UPLOAD_URL_EXPIRATION
+    )
+
+
+@router.post("/uploads/complete", response_model=schemas.S3UploadResponse)
+async def complete_upload(
+    upload: schemas.UploadCompleteRequest,
+    current_user: auth_schemas.UserResponse = Depends(get_current_active_user),
+    s3: AsyncS3Client = Depends(get_async_s3_client)
+):
+    """Confirm a direct upload landed in S3 and passes validation."""
+    if not upload.file_key.startswith(f"{_user_prefix(current_user.id)}/"):
+        raise UnauthorizedFileAccessError()
+    
+    file_info = await s3.get_file_info(upload.file_key)
+    if file_info is None:
+        raise UploadNotFoundError()
+    
+    try:
+        validate_file_type(file_info.content_type)
+        validate_file_size(file_info.file_size)
+    except (InvalidFileTypeError, FileTooLargeError):
+        await s3.delete_file(upload.file_key)
+        raise
+    
+    return schemas.S3UploadResponse(
+        file_url=s3.client.get_file_url(upload.file_key),
+        file_key=upload.file_key,
+        bucket_name=DEFAULT_BUCKET_NAME,
+        uploaded_at=file_info.last_modified
+    )
+
+
+@router.get("/downloads/{file_key:path}")
+async def download_file(
+    file_key: str,
+    request: Request,
+    current_user: auth_schemas.UserResponse = Depends(get_current_active_user),
+    s3: AsyncS3Client = Depends(get_async_s3_client)
+):
+    """
+    Stream one of the user's uploads from S3 in chunks.
+    A single-range Range header gets a 206 with just those bytes.
+    """
+    if not file_key.startswith(f"{_user_prefix(current_user.id)}/"):
+        raise UnauthorizedFileAccessError()
+    
+    byte_range = parse_range_header(request.headers.get("range"))
+    stream = await s3.open_stream(file_key, byte_range=byte_range)
+    return stream_response(stream, s3.iter_stream(stream), download_name=file_key.rsplit("/", 1)[-1])
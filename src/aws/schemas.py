@@ -1,5 +1,5 @@
 """AWS Pydantic schemas."""
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 
@@ -32,3 +32,33 @@ class PresignedURLResponse(BaseModel):
     url: str
     expires_in: int
 
+
+class S3BatchItemResult(BaseModel):
+    """Per-key result of a batch S3 operation."""
+    file_key: str
+    success: bool
+    url: Optional[str] = None
+    error: Optional[str] = None
+
+
+class PresignedUploadRequest(BaseModel):
+    """Direct upload request schema."""
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: str
+    file_size: int = Field(..., gt=0)
+
+
+class PresignedUploadResponse(BaseModel):
+    """
+    Direct upload response schema.
+    The client POSTs the file to url as multipart/form-data with fields first.
+    """
+    url: str
+    fields: dict[str, str]
+    file_key: str
+    expires_in: int
+
+
+class UploadCompleteRequest(BaseModel):
+    """Direct upload completion schema."""
+    file_key: str = Field(..., min_length=1)
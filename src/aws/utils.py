@@ -1,7 +1,17 @@
 """AWS utility functions."""
-from typing import Optional
+import re
+import unicodedata
+from typing import AsyncIterator, Optional
+from urllib.parse import quote
+from fastapi import status
+from fastapi.responses import StreamingResponse
 from src.aws.constants import MAX_FILE_SIZE, ALLOWED_FILE_TYPES
-from src.aws.exceptions import InvalidFileTypeError, FileTooLargeError
+from src.aws.exceptions import InvalidFileTypeError, FileTooLargeError, InvalidRangeError
+
+RANGE_HEADER_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Characters that can't appear in the quoted ASCII filename of a Content-Disposition header
+UNSAFE_FILENAME_PATTERN = re.compile(r'[^\x20-\x7e]')
 
 
 def validate_file_type(content_type: str) -> bool:
@@ -30,7 +40,61 @@ def get_file_extension(filename: str) -> str:
 def generate_file_key(prefix: str, filename: str) -> str:
     """Generate S3 file key with prefix."""
     from datetime import datetime
+    # Drop any client-supplied path so keys always stay under prefix
+    filename = filename.replace("\\", "/").rsplit("/", 1)[-1]
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     extension = get_file_extension(filename)
     return f"{prefix}/{timestamp}_{filename}"
 
+
+def parse_range_header(range_header: Optional[str]) -> Optional[str]:
+    """Validate a single-range HTTP Range header and normalize it for S3."""
+    if not range_header:
+        return None
+    match = RANGE_HEADER_PATTERN.match(range_header.replace(" ", ""))
+    if not match or match.groups() == ("", ""):
+        raise InvalidRangeError()
+    start, end = match.groups()
+    if start and end and int(start) > int(end):
+        raise InvalidRangeError()
+    return f"bytes={start}-{end}"
+
+
+def content_disposition(filename: str) -> str:
+    """
+    Build an attachment Content-Disposition header for any filename.
+    Headers are latin-1, so non-ASCII names go in an RFC 5987 filename* parameter,
+    with a quoted ASCII approximation in filename for older clients.
+    """
+    # Accents are dropped ("café" -> "cafe"); other non-ASCII characters become "_"
+    ascii_name = "".join(
+        char for char in unicodedata.normalize("NFKD", filename) if not unicodedata.combining(char)
+    )
+    ascii_name = UNSAFE_FILENAME_PATTERN.sub("_", ascii_name).replace("\\", "\\\\").replace('"', '\\"')
+    return f"attachment; filename=\"{ascii_name}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+def stream_response(
+    stream,
+    chunks: AsyncIterator[bytes],
+    download_name: Optional[str] = None
+) -> StreamingResponse:
+    """
+    Build a StreamingResponse sending chunks of an S3ObjectStream, partial if it was opened with a range.
+    Pass AsyncS3Client.iter_stream(stream) as chunks, so reads run on the S3 thread pool.
+    """
+    headers = {"Accept-Ranges": "bytes"}
+    if stream.content_length is not None:
+        headers["Content-Length"] = str(stream.content_length)
+    if stream.content_range:
+        headers["Content-Range"] = stream.content_range
+    if stream.etag:
+        headers["ETag"] = stream.etag
+    if download_name:
+        headers["Content-Disposition"] = content_disposition(download_name)
+    return StreamingResponse(
+        chunks,
+        status_code=status.HTTP_206_PARTIAL_CONTENT if stream.content_range else status.HTTP_200_OK,
+        media_type=stream.content_type or "application/octet-stream",
+        headers=headers
+    )
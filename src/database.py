@@ -1,18 +1,394 @@
 """Database connection and session management."""
-from sqlalchemy import create_engine
+import asyncio
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+from fastapi import Request
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from src.config import settings
+from src.metrics import DB_QUERY_DURATION_SECONDS
+
+# Async drivers used for each sync dialect in DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+# Pool defaults per DB_ENGINE_PROFILE; DB_POOL_* settings override them.
+# Production skips pre-ping and relies on pool_recycle staying below the server's
+# idle timeout, plus SQLAlchemy invalidating the pool on a disconnect error.
+ENGINE_PROFILES = {
+    "development": {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    },
+    "production": {
+        "pool_size": 10,
+        "max_overflow": 5,
+        "pool_timeout": 10,
+        "pool_recycle": 1800,
+        "pool_pre_ping": False,
+    },
+    "test": {
+        "pool_size": 2,
+        "max_overflow": 2,
+        "pool_timeout": 5,
+        "pool_recycle": -1,
+        "pool_pre_ping": False,
+    },
+}
+
+# Statement types timed separately; anything else is labelled OTHER
+SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+# Cookie set after a write so the client's next reads see it on the primary
+READ_YOUR_WRITES_COOKIE = "db_primary_until"
+
+POOL_SETTING_OVERRIDES = {
+    key: value
+    for key, value in {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }.items()
+    if value is not None
+}
+
+
+def get_async_database_url(url: str) -> str:
+    """Convert a sync database URL into its async driver equivalent."""
+    db_url = make_url(url)
+    backend = db_url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return db_url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+class PoolMetrics:
+    """Thread-safe checkout counters for a connection pool."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+    
+    def record_checkout(self, wait: float) -> None:
+        """Record a successful checkout and how long it waited."""
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += wait
+            self.wait_seconds_max = max(self.wait_seconds_max, wait)
+    
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up after pool_timeout."""
+        with self._lock:
+            self.timeouts += 1
+    
+    def stats(self) -> dict:
+        """Get checkout counters."""
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "wait_seconds_avg": self.wait_seconds_total / self.checkouts if self.checkouts else 0.0,
+            }
+
+
+class PoolMetricsMixin:
+    """Time how long each checkout waits for a connection."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+    
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - started_at)
+        return connection
+    
+    def recreate(self):
+        # Keep counting across engine.dispose(), which swaps in a new pool
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedQueuePool(PoolMetricsMixin, QueuePool):
+    """QueuePool with checkout metrics."""
+
+
+class TimedAsyncAdaptedQueuePool(PoolMetricsMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout metrics."""
+
+
+class QueryStats:
+    """Statements run while handling one request."""
+    
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter[str] = Counter()
+    
+    def record(self, statement: str, duration: float) -> None:
+        """Record a finished statement."""
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+    
+    def repeated_statements(self, threshold: int) -> dict[str, int]:
+        """
+        Get statements run at least threshold times.
+        The SQL text is the same whatever the bound values, so a query issued once
+        per row of a list (an N+1 pattern) shows up here.
+        """
+        return {statement: count for statement, count in self.statements.items() if count >= threshold}
+
+
+# Stats for the request being handled, set by QueryStatsMiddleware
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+def instrument_engine(sync_engine: Engine, name: str) -> None:
+    """
+    Time every statement an engine runs, labelled by engine name and SQL operation,
+    and add it to the current request's QueryStats.
+    """
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+    
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["query_started_at"].pop()
+        if settings.METRICS_ENABLED:
+            operation = statement.lstrip()[:6].upper()
+            DB_QUERY_DURATION_SECONDS.observe(
+                duration,
+                engine=name,
+                operation=operation if operation in SQL_OPERATIONS else "OTHER"
+            )
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.record(statement, duration)
+    
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        if context.connection is not None:
+            started = context.connection.info.get("query_started_at")
+            if started:
+                started.pop()
+
+
+def get_statement_timeout_args(db_url: URL, statement_timeout_ms: int) -> dict:
+    """Get driver connect_args that set a server-side statement timeout."""
+    if not statement_timeout_ms or db_url.get_backend_name() != "postgresql":
+        return {}
+    if db_url.get_driver_name() == "asyncpg":
+        return {"server_settings": {"statement_timeout": str(statement_timeout_ms)}}
+    return {"options": f"-c statement_timeout={statement_timeout_ms}"}
+
+
+def get_engine_options(
+    url: str,
+    profile: str = settings.DB_ENGINE_PROFILE,
+    overrides: Optional[dict] = None,
+    statement_timeout_ms: int = settings.DB_STATEMENT_TIMEOUT_MS
+) -> dict:
+    """
+    Build engine keyword arguments for a URL from an engine profile.
+    Pool sizing only applies to dialects that pool with QueuePool; SQLite memory
+    and aiosqlite databases keep their own pool classes.
+    """
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(f"Unknown engine profile '{profile}'")
+    pool_options = {**ENGINE_PROFILES[profile], **(POOL_SETTING_OVERRIDES if overrides is None else overrides)}
+    
+    db_url = make_url(url)
+    options = {"echo": settings.DEBUG, "pool_pre_ping": pool_options.pop("pool_pre_ping")}
+    pool_class = db_url.get_dialect().get_pool_class(db_url)
+    if issubclass(pool_class, QueuePool):
+        options.update(pool_options)
+        options["poolclass"] = (
+            TimedAsyncAdaptedQueuePool if issubclass(pool_class, AsyncAdaptedQueuePool) else TimedQueuePool
+        )
+    
+    connect_args = get_statement_timeout_args(db_url, statement_timeout_ms)
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def get_pool_stats(engine) -> dict:
+    """Get connection pool status and checkout metrics for a sync or async engine."""
+    pool = getattr(engine, "sync_engine", engine).pool
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.stats())
+    return stats
+
+
+class ReplicaSet:
+    """
+    Round-robin over read replica session factories.
+    A replica that errors is skipped for retry_seconds, then tried again.
+    """
+    
+    def __init__(self, urls: list[str], retry_seconds: float = settings.DB_REPLICA_RETRY_SECONDS):
+        self.urls = [get_async_database_url(url) for url in urls]
+        self.engines = [create_async_engine(url, **get_engine_options(url)) for url in self.urls]
+        for replica_engine in self.engines:
+            instrument_engine(replica_engine.sync_engine, "replica")
+        self.sessionmakers = [
+            async_sessionmaker(bind=replica_engine, autoflush=False, expire_on_commit=False)
+            for replica_engine in self.engines
+        ]
+        self.retry_seconds = retry_seconds
+        self._unhealthy_until = [0.0] * len(self.engines)
+        self._checked_at: Optional[float] = None
+        self._next = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.engines)
+    
+    def next_index(self) -> Optional[int]:
+        """Get the next healthy replica in rotation, or None if none is usable."""
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.engines)):
+                index = self._next
+                self._next = (self._next + 1) % len(self.engines)
+                if self._unhealthy_until[index] <= now:
+                    return index
+        return None
+    
+    def mark_unhealthy(self, index: int) -> None:
+        """Skip a replica for retry_seconds."""
+        with self._lock:
+            self._unhealthy_until[index] = time.monotonic() + self.retry_seconds
+    
+    def mark_healthy(self, index: int) -> None:
+        """Put a replica back in rotation."""
+        with self._lock:
+            self._unhealthy_until[index] = 0.0
+    
+    def is_healthy(self, index: int) -> bool:
+        """Check if a replica is in rotation."""
+        return self._unhealthy_until[index] <= time.monotonic()
+    
+    async def check(self) -> None:
+        """Ping every replica, updating its health, at most once per retry_seconds."""
+        now = time.monotonic()
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.retry_seconds:
+                return
+            self._checked_at = now
+        for index, replica_engine in enumerate(self.engines):
+            try:
+                async with replica_engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+            except (exc.DBAPIError, OSError):
+                self.mark_unhealthy(index)
+            else:
+                self.mark_healthy(index)
+    
+    def stats(self) -> list[dict]:
+        """Get health and pool stats per replica."""
+        return [
+            {
+                "url": make_url(url).render_as_string(hide_password=True),
+                "healthy": self.is_healthy(index),
+                **get_pool_stats(replica_engine),
+            }
+            for index, (url, replica_engine) in enumerate(zip(self.urls, self.engines))
+        ]
+
+
+async def warm_up_engine(async_engine: AsyncEngine, connections: int) -> None:
+    """Open connections ahead of traffic so the first requests don't pay to connect."""
+    async def connect():
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    
+    await asyncio.gather(*(connect() for _ in range(connections)))
+
+
+async def ping_engine(async_engine: AsyncEngine, timeout: float) -> bool:
+    """Run SELECT 1 on an engine, returning False if it fails or takes longer than timeout."""
+    async def ping():
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    
+    try:
+        await asyncio.wait_for(ping(), timeout)
+    except (exc.DBAPIError, OSError, asyncio.TimeoutError):
+        return False
+    return True
+
+
+def dispose_engines_after_fork() -> None:
+    """
+    Drop pooled connections inherited from the parent after a fork.
+    close=False leaves the parent's sockets alone; the child opens its own.
+    """
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+    for replica_engine in replicas.engines:
+        replica_engine.sync_engine.dispose(close=False)
+
 
 # Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=settings.DEBUG,
-)
+engine = create_engine(settings.DATABASE_URL, **get_engine_options(settings.DATABASE_URL))
+
+# Create async database engine
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **get_engine_options(ASYNC_DATABASE_URL))
+
+instrument_engine(engine, "primary")
+instrument_engine(async_engine.sync_engine, "primary")
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async session factory
+# Objects stay usable after commit, since lazy refreshes are not possible in async code
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Read replicas; empty when DATABASE_REPLICA_URLS is unset
+replicas = ReplicaSet(settings.DATABASE_REPLICA_URLS)
+
 # Base class for models
 Base = declarative_base()
 
@@ -25,3 +401,44 @@ def get_db():
     finally:
         db.close()
 
+
+async def get_async_db():
+    """Dependency for getting async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def reads_from_primary(request: Request) -> bool:
+    """
+    Check if a client wrote recently enough that it must read from the primary.
+    Values past the window (including inf) were not set by us and are ignored,
+    so a forged cookie can't pin a client to the primary.
+    """
+    primary_until = request.cookies.get(READ_YOUR_WRITES_COOKIE)
+    try:
+        until = float(primary_until) if primary_until is not None else 0.0
+    except ValueError:
+        return False
+    now = time.time()
+    return now < until <= now + settings.READ_YOUR_WRITES_SECONDS
+
+
+async def get_read_db(request: Request):
+    """
+    Dependency for getting a read-only async database session.
+    Uses a replica unless none is configured or healthy, or the client wrote recently.
+    """
+    index = None
+    if len(replicas) and not reads_from_primary(request):
+        index = replicas.next_index()
+    if index is None:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+    
+    async with replicas.sessionmakers[index]() as db:
+        try:
+            yield db
+        except (exc.DBAPIError, OSError):
+            replicas.mark_unhealthy(index)
+            raise
@@ -31,6 +31,12 @@ class ForbiddenError(BaseAPIException):
         super().__init__(message, status_code=403)
 
 
+class InvalidCursorError(BaseAPIException):
+    """Invalid pagination cursor exception."""
+    def __init__(self, message: str = "Invalid pagination cursor"):
+        super().__init__(message, status_code=400)
+
+
 async def base_exception_handler(request: Request, exc: BaseAPIException):
     """Handle base API exceptions."""
     return JSONResponse(
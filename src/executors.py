@@ -0,0 +1,34 @@
+"""Thread pool helpers."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+
+class LazyThreadPool:
+    """
+    Thread pool created on first use and recreated after shutdown.
+    Pools built at import time would be inherited, threadless, by forked workers.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = ""):
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> ThreadPoolExecutor:
+        """Get the executor, creating it if needed."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.thread_name_prefix
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Shut down the executor, waiting for running jobs."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,193 @@
+"""Logging setup: a queue in front of every handler, JSON or text output, file rotation.
+
+Handlers run on a background QueueListener thread, so code on the event loop only
+pays for building a record and putting it on a queue; formatting and I/O never block it.
+"""
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+from typing import Optional
+from src.config import settings
+
+# Logger the access log middleware writes to
+ACCESS_LOGGER_NAME = "src.access"
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+TEXT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Id of the request being handled, added to every record logged while serving it
+current_request_id: ContextVar[Optional[str]] = ContextVar("current_request_id", default=None)
+
+# Attributes every LogRecord has; anything else was passed in `extra` and becomes a JSON field
+RESERVED_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional["LogQueueHandler"] = None
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including fields passed in `extra`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RESERVED_ATTRIBUTES and value is not None:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Queue records for the listener thread with the request id attached.
+    Unlike the stdlib handler it doesn't format the message here: only the
+    arguments are merged and any traceback rendered, since those can't wait.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        if getattr(record, "request_id", None) is None:
+            record.request_id = current_request_id.get()
+        return record
+
+
+def create_formatter(log_format: str) -> logging.Formatter:
+    """Create the formatter for a LOG_FORMAT value."""
+    if log_format == "json":
+        return JSONFormatter()
+    if log_format == "text":
+        return logging.Formatter(TEXT_FORMAT, datefmt=TEXT_DATE_FORMAT)
+    raise ValueError(f"Unknown log format '{log_format}'")
+
+
+def create_file_handler(
+    filename: str,
+    rotation: str = settings.LOG_ROTATION,
+    max_bytes: int = settings.LOG_MAX_BYTES,
+    when: str = settings.LOG_ROTATION_WHEN,
+    backup_count: int = settings.LOG_BACKUP_COUNT
+) -> logging.Handler:
+    """Create a file handler rotating by size or by time."""
+    if rotation == "size":
+        return RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+    if rotation == "time":
+        return TimedRotatingFileHandler(filename, when=when, backupCount=backup_count, encoding="utf-8", utc=True)
+    raise ValueError(f"Unknown log rotation '{rotation}'")
+
+
+def configure_logging(
+    level: str = settings.LOG_LEVEL,
+    log_format: str = settings.LOG_FORMAT,
+    log_file: Optional[str] = settings.LOG_FILE,
+    access_log: bool = settings.ACCESS_LOG_ENABLED,
+    handlers: Optional[list[logging.Handler]] = None
+) -> QueueListener:
+    """
+    Send all logging through a queue to handlers on a background thread.
+    Replaces the root logger's handlers, routes uvicorn's loggers to the root, and
+    silences uvicorn's access log when the access log middleware replaces it.
+    """
+    global _listener, _queue_handler
+    stop_logging()
+
+    if handlers is None:
+        formatter = create_formatter(log_format)
+        handlers = [logging.StreamHandler(sys.stdout)]
+        if log_file:
+            handlers.append(create_file_handler(log_file))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+    _queue_handler = LogQueueHandler(queue.SimpleQueue())
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(level.upper())
+
+    route_uvicorn_logs_to_root()
+    logging.getLogger("uvicorn.access").disabled = access_log
+
+    _listener = QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def route_uvicorn_logs_to_root() -> None:
+    """Drop uvicorn's own handlers so its server logs go through the root logger's queue."""
+    for name in ("uvicorn", "uvicorn.error"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+
+
+def stop_logging() -> None:
+    """Stop the listener after it has written every queued record."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def reopen_file_handler_for_process(handler: logging.Handler) -> logging.Handler:
+    """
+    Give a forked process its own copy of a rotating file handler, writing to a
+    file named with its pid (app.log -> app.1234.log). Processes sharing one file
+    interleave writes and rotate it from under each other.
+    """
+    if not isinstance(handler, (RotatingFileHandler, TimedRotatingFileHandler)):
+        return handler
+    root, extension = os.path.splitext(handler.baseFilename)
+    filename = f"{root}.{os.getpid()}{extension}"
+    if isinstance(handler, RotatingFileHandler):
+        reopened = RotatingFileHandler(
+            filename, maxBytes=handler.maxBytes, backupCount=handler.backupCount, encoding=handler.encoding
+        )
+    else:
+        reopened = TimedRotatingFileHandler(
+            filename, when=handler.when, backupCount=handler.backupCount, encoding=handler.encoding, utc=handler.utc
+        )
+    reopened.setFormatter(handler.formatter)
+    reopened.setLevel(handler.level)
+    handler.close()
+    return reopened
+
+
+def restart_logging_after_fork() -> None:
+    """
+    Start a listener in a forked worker, which doesn't inherit the parent's thread.
+    A fresh queue keeps the child from sharing the parent's queue state or records,
+    and log files are reopened per worker.
+    """
+    global _listener
+    if _queue_handler is None or _listener is None:
+        return
+    handlers = [reopen_file_handler_for_process(handler) for handler in _listener.handlers]
+    _queue_handler.queue = queue.SimpleQueue()
+    _listener = QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+# Registered after the logging module's own exit hook, so it runs first and
+# queued records are written before handlers are flushed and closed
+atexit.register(stop_logging)
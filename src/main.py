@@ -1,33 +1,86 @@
 """Main FastAPI application."""
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import os
 
 from src.config import settings
+from src.logging_config import configure_logging
 from src.exceptions import (
     BaseAPIException,
     base_exception_handler,
     validation_exception_handler,
     http_exception_handler
 )
-from src.database import engine, Base
+from src.database import engine, async_engine, replicas, get_pool_stats, ping_engine, warm_up_engine
+from src.middleware import (
+    ReadYourWritesMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    QueryStatsMiddleware,
+    AccessLogMiddleware
+)
+from src import metrics
 
 # Import routers
 from src.auth.router import router as auth_router
 from src.posts.router import router as posts_router
+from src.aws.router import router as files_router
+from src.profiling.router import router as profiling_router
+from src.aws.client import get_async_s3_client
+from src.auth.hashing import password_hasher
+
+# Before anything logs, so every record goes through the background queue
+configure_logging()
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_up_database() -> None:
+    """Warm up the connection pools, logging rather than failing on errors."""
+    try:
+        await warm_up_engine(async_engine, settings.DB_WARMUP_CONNECTIONS)
+    except Exception:
+        logger.warning("Database warm-up failed; connections will open on first use", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm up the database in the background and release resources on shutdown.
+    The schema is managed by Alembic, so startup never touches it.
+    """
+    warmup = None
+    if settings.DB_WARMUP_CONNECTIONS > 0:
+        warmup = asyncio.create_task(_warm_up_database())
+    
+    yield
+    
+    if warmup is not None:
+        warmup.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup
+    password_hasher.shutdown()
+    if get_async_s3_client.cache_info().currsize:
+        get_async_s3_client().shutdown()
+    await async_engine.dispose()
+    engine.dispose()
+    for replica_engine in replicas.engines:
+        await replica_engine.dispose()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -39,6 +92,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Keep clients on the primary right after they write, when reads go to replicas
+if len(replicas):
+    app.add_middleware(ReadYourWritesMiddleware)
+
+# Per-request query counting for N+1 warnings, plus a Server-Timing header when enabled
+app.add_middleware(QueryStatsMiddleware, emit_header=settings.SERVER_TIMING_ENABLED)
+
+# Opt-in request profiling
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# Request metrics, timed around every middleware added above
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Outermost, so the request id covers everything logged while serving the request
+if settings.ACCESS_LOG_ENABLED:
+    app.add_middleware(AccessLogMiddleware)
+
 # Register exception handlers
 app.add_exception_handler(BaseAPIException, base_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
@@ -47,6 +119,8 @@ app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 # Include routers
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["auth"])
 app.include_router(posts_router, prefix="/api/v1/posts", tags=["posts"])
+app.include_router(files_router, prefix="/api/v1/files", tags=["files"])
+app.include_router(profiling_router, prefix="/api/v1/admin/profiles", tags=["profiling"])
 
 # Serve static files and templates
 templates_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
@@ -70,3 +144,31 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/health/db")
+async def database_health_check():
+    """
+    Primary database reachability, plus connection pool status and checkout metrics
+    for this worker. Returns 503 when the primary doesn't answer SELECT 1 in time.
+    """
+    healthy = await ping_engine(async_engine, settings.DB_HEALTH_CHECK_TIMEOUT_SECONDS)
+    await replicas.check()
+    return JSONResponse(
+        status_code=200 if healthy else 503,
+        content={
+            "status": "healthy" if healthy else "unhealthy",
+            "pools": {
+                "sync": get_pool_stats(engine),
+                "async": get_pool_stats(async_engine),
+            },
+            "replicas": replicas.stats(),
+        }
+    )
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics_endpoint():
+        """Metrics for this worker in the Prometheus text format."""
+        return Response(content=metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
@@ -0,0 +1,262 @@
+"""ASGI middleware."""
+import asyncio
+import logging
+import random
+import re
+import time
+import uuid
+from http.cookies import SimpleCookie
+from src.config import settings
+from src.database import READ_YOUR_WRITES_COOKIE, QueryStats, current_query_stats
+from src.logging_config import ACCESS_LOGGER_NAME, current_request_id
+from src.metrics import HTTP_REQUESTS_TOTAL, HTTP_REQUESTS_IN_PROGRESS, HTTP_REQUEST_DURATION_SECONDS
+from src.profiling.constants import PROFILE_REQUEST_HEADER, PROFILE_ID_HEADER
+from src.profiling.profiler import RequestProfiler, request_profiler
+
+logger = logging.getLogger(__name__)
+access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+HTTP_METHODS = {"GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"}
+
+# Route label for requests that matched no route, so unknown paths can't add series
+UNMATCHED_ROUTE = "<unmatched>"
+
+# Incoming request ids are reused only if they look like ids, so clients can't inject log content
+REQUEST_ID_HEADER = b"x-request-id"
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pin a client's reads to the primary for a short window after it writes.
+    Successful non-GET requests set a cookie that get_read_db checks, so reads
+    don't hit a replica that hasn't caught up with the client's own change yet.
+    """
+    
+    def __init__(self, app, window_seconds: int = settings.READ_YOUR_WRITES_SECONDS):
+        self.app = app
+        self.window_seconds = window_seconds
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS or self.window_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = SimpleCookie()
+                cookie[READ_YOUR_WRITES_COOKIE] = f"{time.time() + self.window_seconds:.3f}"
+                cookie[READ_YOUR_WRITES_COOKIE]["max-age"] = self.window_seconds
+                cookie[READ_YOUR_WRITES_COOKIE]["path"] = "/"
+                cookie[READ_YOUR_WRITES_COOKIE]["httponly"] = True
+                cookie[READ_YOUR_WRITES_COOKIE]["samesite"] = "lax"
+                header = cookie.output(header="").strip().encode("latin-1")
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", header)]}
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cookie)
+
+
+class MetricsMiddleware:
+    """
+    Record request count, in-flight requests and latency per route.
+    Routes are labelled by their path template (e.g. /api/v1/posts/{post_id}),
+    which FastAPI leaves in the scope after routing.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"] if scope["method"] in HTTP_METHODS else "OTHER"
+        status_code = 500
+        
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        HTTP_REQUESTS_IN_PROGRESS.inc(method=method)
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started_at
+            HTTP_REQUESTS_IN_PROGRESS.dec(method=method)
+            route = scope.get("route")
+            route_label = getattr(route, "path_format", None) or UNMATCHED_ROUTE
+            HTTP_REQUESTS_TOTAL.inc(method=method, route=route_label, status=str(status_code))
+            HTTP_REQUEST_DURATION_SECONDS.observe(duration, method=method, route=route_label)
+
+
+class ProfilingMiddleware:
+    """
+    Profile sampled requests, or ones sent with an X-Profile header carrying PROFILING_SECRET.
+    The report id is returned in X-Profile-Id; admins read reports under
+    /api/v1/admin/profiles.
+    """
+    
+    def __init__(self, app, profiler: RequestProfiler = request_profiler):
+        self.app = app
+        self.profiler = profiler
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        header_value = None
+        for name, value in scope["headers"]:
+            if name == PROFILE_REQUEST_HEADER.encode():
+                header_value = value.decode("latin-1")
+                break
+        session = self.profiler.start() if self.profiler.should_profile(header_value) else None
+        if session is None:
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def send_with_profile_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), (PROFILE_ID_HEADER.lower().encode(), session.profile_id.encode())]
+                }
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            self.profiler.stop(session)
+            route = getattr(scope.get("route"), "path_format", None)
+            # Building and writing the report is blocking work, so keep it off the loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.profiler.write_report, session, scope["method"], scope["path"], route, status_code
+            )
+
+
+class QueryStatsMiddleware:
+    """
+    Count the queries each request runs. Statements repeated at least
+    repeated_query_threshold times are logged as likely N+1 queries. With emit_header,
+    the count and DB time are also reported in a Server-Timing header,
+    e.g. `db;dur=4.2;desc="3 queries", app;dur=9.8`.
+    """
+    
+    def __init__(
+        self,
+        app,
+        repeated_query_threshold: int = settings.DB_REPEATED_QUERY_THRESHOLD,
+        emit_header: bool = settings.SERVER_TIMING_ENABLED
+    ):
+        self.app = app
+        self.repeated_query_threshold = repeated_query_threshold
+        self.emit_header = emit_header
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started_at = time.perf_counter()
+        
+        async def send_with_server_timing(message):
+            if self.emit_header and message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter() - started_at) * 1000
+                queries = f"{stats.count} {'query' if stats.count == 1 else 'queries'}"
+                server_timing = f'db;dur={stats.duration * 1000:.2f};desc="{queries}", app;dur={elapsed_ms:.2f}'
+                message = {**message, "headers": [*message.get("headers", []), (b"server-timing", server_timing.encode())]}
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            current_query_stats.reset(token)
+            repeated = stats.repeated_statements(self.repeated_query_threshold)
+            if repeated:
+                route = getattr(scope.get("route"), "path_format", None) or scope["path"]
+                for statement, count in repeated.items():
+                    logger.warning(
+                        "Possible N+1 query: %s %s ran the same statement %d times: %s",
+                        scope["method"], route, count, " ".join(statement.split())[:500]
+                    )
+
+
+class AccessLogMiddleware:
+    """
+    Tag each request with an id and write one structured access log record for it.
+    The id comes from the X-Request-ID header when valid, is echoed in the response,
+    and is attached to every record logged while the request is served. Successful
+    requests are sampled at sample_rate; server errors and slow requests always log.
+    """
+    
+    def __init__(
+        self,
+        app,
+        sample_rate: float = settings.ACCESS_LOG_SAMPLE_RATE,
+        slow_ms: int = settings.ACCESS_LOG_SLOW_MS
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")
+                break
+        if request_id is None or not REQUEST_ID_PATTERN.match(request_id):
+            request_id = uuid.uuid4().hex
+        
+        token = current_request_id.set(request_id)
+        status_code = 500
+        started_at = time.perf_counter()
+        
+        async def send_with_request_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message = {**message, "headers": [*message.get("headers", []), (REQUEST_ID_HEADER, request_id.encode())]}
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            current_request_id.reset(token)
+            duration_ms = (time.perf_counter() - started_at) * 1000
+            if access_logger.isEnabledFor(logging.INFO) and (
+                status_code >= 500
+                or duration_ms >= self.slow_ms
+                or random.random() < self.sample_rate
+            ):
+                route = getattr(scope.get("route"), "path_format", None)
+                client = scope.get("client")
+                access_logger.info(
+                    "%s %s %d %.2fms", scope["method"], scope["path"], status_code, duration_ms,
+                    extra={
+                        "request_id": request_id,
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "route": route,
+                        "status": status_code,
+                        "duration_ms": round(duration_ms, 3),
+                        "client": client[0] if client else None,
+                        "sample_rate": self.sample_rate,
+                    }
+                )
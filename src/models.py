@@ -1,14 +1,20 @@
 """Global database models."""
 from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.sql import func
 from src.database import Base
 
+# SQLite's CURRENT_TIMESTAMP has no fractional seconds, so bind timestamps in the
+# same format there; otherwise keyset comparisons against server defaults never match.
+Timestamp = DateTime(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite")
+
 
 class BaseModel(Base):
     """Base model with common fields."""
     __abstract__ = True
+    # Fetch server-generated timestamps with RETURNING on INSERT/UPDATE instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-
+    created_at = Column(Timestamp, server_default=func.now())
+    updated_at = Column(Timestamp, onupdate=func.now())
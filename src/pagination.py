@@ -1,14 +1,35 @@
 """Pagination utilities."""
-from typing import Generic, TypeVar, Optional
+import base64
+import json
+from datetime import datetime
+from typing import Generic, Hashable, TypeVar, Optional
 from pydantic import BaseModel, Field
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.cache import TTLCache
+from src.config import settings
+from src.exceptions import InvalidCursorError
 
 T = TypeVar('T')
 
+# Count modes
+COUNT_MODE_EXACT = "exact"
+COUNT_MODE_CACHED = "cached"
+COUNT_MODE_ESTIMATED = "estimated"
+
 
 class PaginationParams(BaseModel):
     """Pagination parameters."""
     page: int = Field(default=1, ge=1, description="Page number")
     page_size: int = Field(default=10, ge=1, le=100, description="Items per page")
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor from a previous response's next_cursor; overrides page"
+    )
+    include_total: bool = Field(
+        default=True,
+        description="Include total and total_pages; disable to skip counting rows"
+    )
     
     @property
     def skip(self) -> int:
@@ -21,29 +42,97 @@ class PaginationParams(BaseModel):
         return self.page_size
 
 
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    raw = json.dumps([created_at.isoformat(), item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode an opaque cursor into its (created_at, id) keyset position."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (ValueError, TypeError):
+        raise InvalidCursorError()
+
+
+async def estimate_row_count(db: AsyncSession, table_name: str) -> Optional[int]:
+    """Get the Postgres planner's row estimate for a table, if one is available."""
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    estimate = await db.scalar(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": table_name}
+    )
+    # reltuples is -1 for tables that have never been analyzed
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+async def count_total(
+    db: AsyncSession,
+    query: Select,
+    cache: Optional[TTLCache] = None,
+    cache_key: Optional[Hashable] = None,
+    estimate_table: Optional[str] = None,
+    mode: str = settings.PAGINATION_COUNT_MODE
+) -> tuple[int, bool]:
+    """
+    Count the rows matched by query according to the count mode.
+    Pass estimate_table only for unfiltered queries over that table.
+    Returns the total and whether it is a planner estimate.
+    """
+    if mode == COUNT_MODE_ESTIMATED and estimate_table is not None:
+        estimate = await estimate_row_count(db, estimate_table)
+        if estimate is not None:
+            return estimate, True
+    
+    use_cache = mode in (COUNT_MODE_CACHED, COUNT_MODE_ESTIMATED) and cache is not None
+    if use_cache:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached, False
+    
+    total = await db.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+    if use_cache:
+        cache.set(cache_key, total)
+    return total, False
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response model."""
     items: list[T]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
     
     @classmethod
     def create(
         cls,
         items: list[T],
-        total: int,
+        total: Optional[int],
         page: int,
-        page_size: int
+        page_size: int,
+        next_cursor: Optional[str] = None,
+        total_is_estimate: bool = False
     ) -> "PaginatedResponse[T]":
         """Create paginated response."""
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+        if total is None:
+            total_pages = None
+        else:
+            total_pages = (total + page_size - 1) // page_size if total > 0 else 0
         return cls(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages
+            total_pages=total_pages,
+            total_is_estimate=total_is_estimate,
+            next_cursor=next_cursor
         )
-
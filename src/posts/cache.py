@@ -0,0 +1,70 @@
+"""Posts response cache."""
+from typing import NamedTuple, Optional
+from src.cache import CacheBackend, create_cache_backend, make_etag
+from src.pagination import PaginationParams
+from src.posts.config import (
+    FEED_CACHE_BACKEND,
+    FEED_CACHE_REDIS_URL,
+    FEED_CACHE_TTL_SECONDS,
+    FEED_CACHE_MAX_SIZE
+)
+
+FEED_KEY_PREFIX = "posts:feed"
+FEED_VERSION_KEY = f"{FEED_KEY_PREFIX}:version"
+
+
+class CachedPage(NamedTuple):
+    """Serialized response body with its ETag."""
+    body: bytes
+    etag: str
+
+
+class FeedCache:
+    """
+    Cache of serialized public feed pages.
+    Keys embed a version counter, so invalidation is a single increment and
+    stale pages simply age out of the backend.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: int = FEED_CACHE_TTL_SECONDS):
+        self.backend = backend
+        self.ttl = ttl
+
+    async def key(self, pagination: PaginationParams) -> str:
+        """
+        Build the cache key for a page at the current feed version.
+        Build it once per request and pass it to both get and set, so a page read
+        before a write is never stored under the version that write created.
+        """
+        version = await self.backend.get(FEED_VERSION_KEY)
+        version = int(version) if version else 0
+        return (
+            f"{FEED_KEY_PREFIX}:v{version}:{pagination.page}:{pagination.page_size}"
+            f":{pagination.cursor or ''}:{int(pagination.include_total)}"
+        )
+
+    async def get(self, key: str) -> Optional[CachedPage]:
+        """Get a cached page, if any."""
+        if self.ttl <= 0:
+            return None
+        value = await self.backend.get(key)
+        if value is None:
+            return None
+        etag, body = value.split(b"\n", 1)
+        return CachedPage(body=body, etag=etag.decode())
+
+    async def set(self, key: str, body: bytes) -> CachedPage:
+        """Cache a serialized page."""
+        page = CachedPage(body=body, etag=make_etag(body))
+        if self.ttl > 0:
+            value = page.etag.encode() + b"\n" + body
+            await self.backend.set(key, value, self.ttl)
+        return page
+
+    async def invalidate(self) -> None:
+        """Invalidate every cached page."""
+        await self.backend.incr(FEED_VERSION_KEY)
+
+
+# Shared feed cache instance
+feed_cache = FeedCache(create_cache_backend(FEED_CACHE_BACKEND, FEED_CACHE_REDIS_URL, FEED_CACHE_MAX_SIZE))
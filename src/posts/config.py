@@ -0,0 +1,12 @@
+"""Posts module configuration."""
+from src.config import settings
+
+# Post count cache settings
+POST_COUNT_CACHE_TTL_SECONDS = settings.PAGINATION_COUNT_CACHE_TTL_SECONDS
+POST_COUNT_CACHE_MAX_SIZE = 1024
+
+# Public feed response cache settings
+FEED_CACHE_BACKEND = settings.RESPONSE_CACHE_BACKEND
+FEED_CACHE_REDIS_URL = settings.REDIS_URL
+FEED_CACHE_TTL_SECONDS = settings.FEED_CACHE_TTL_SECONDS
+FEED_CACHE_MAX_SIZE = 1024
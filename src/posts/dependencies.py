@@ -1,25 +1,43 @@
 """Posts dependencies."""
 from typing import Optional
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from src.database import get_db
+from sqlalchemy import select
+from sqlalchemy.orm import undefer
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database import get_async_db, get_read_db
 from src.posts import models, exceptions
 from src.auth.dependencies import get_current_active_user
 from src.auth import schemas as auth_schemas
 
 
-def get_post_or_404(
-    post_id: int,
-    db: Session = Depends(get_db)
-) -> models.Post:
-    """Get post by ID or raise 404."""
-    post = db.query(models.Post).filter(models.Post.id == post_id).first()
+async def _load_post_or_404(db: AsyncSession, post_id: int) -> models.Post:
+    """Load a post with its content or raise 404."""
+    result = await db.execute(
+        select(models.Post).options(undefer(models.Post.content)).where(models.Post.id == post_id)
+    )
+    post = result.scalars().first()
     if not post:
         raise exceptions.PostNotFoundError()
     return post
 
 
-def verify_post_owner(
+async def get_post_or_404(
+    post_id: int,
+    db: AsyncSession = Depends(get_async_db)
+) -> models.Post:
+    """Get post by ID or raise 404, in the primary session used for writes."""
+    return await _load_post_or_404(db, post_id)
+
+
+async def get_read_post_or_404(
+    post_id: int,
+    db: AsyncSession = Depends(get_read_db)
+) -> models.Post:
+    """Get post by ID or raise 404, for read-only routes."""
+    return await _load_post_or_404(db, post_id)
+
+
+async def verify_post_owner(
     post: models.Post = Depends(get_post_or_404),
     current_user: auth_schemas.UserResponse = Depends(get_current_active_user)
 ) -> models.Post:
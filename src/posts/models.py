@@ -1,6 +1,6 @@
 """Posts database models."""
-from sqlalchemy import Column, String, Text, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, ForeignKey, Boolean, Index, text
+from sqlalchemy.orm import deferred, relationship
 from src.models import BaseModel
 from src.posts.constants import POST_STATUS_DRAFT
 
@@ -8,9 +8,22 @@ from src.posts.constants import POST_STATUS_DRAFT
 class Post(BaseModel):
     """Post model."""
     __tablename__ = "posts"
+    __table_args__ = (
+        # Author listings: WHERE author_id = ? ORDER BY created_at DESC, id DESC
+        Index("ix_posts_author_id_created_at_id", "author_id", text("created_at DESC"), text("id DESC")),
+        # Public feed: only published posts, in listing order
+        Index(
+            "ix_posts_published_created_at_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("is_published = true AND status = 'published'"),
+            sqlite_where=text("is_published = 1 AND status = 'published'"),
+        ),
+    )
     
     title = Column(String, nullable=False, index=True)
-    content = Column(Text, nullable=False)
+    # Large body, loaded only when a query asks for it with undefer()
+    content = deferred(Column(Text, nullable=False))
     status = Column(String, default=POST_STATUS_DRAFT, nullable=False)
     is_published = Column(Boolean, default=False)
     author_id = Column(ForeignKey("users.id"), nullable=False)
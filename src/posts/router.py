@@ -1,48 +1,64 @@
 """Posts router endpoints."""
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from src.database import get_db
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database import get_async_db, get_read_db
 from src.posts import schemas, service, dependencies, models
 from src.auth.dependencies import get_current_active_user
 from src.auth import schemas as auth_schemas
 from src.pagination import PaginationParams, PaginatedResponse
+from src.cache import etag_matches
 
 router = APIRouter()
 
 
 @router.get("/", response_model=PaginatedResponse[schemas.PostListResponse])
 async def list_posts(
+    request: Request,
     pagination: PaginationParams = Depends(),
     published_only: bool = True,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get list of posts."""
-    return service.get_posts(db, pagination, published_only=published_only)
+    """
+    Get list of posts.
+    The shared feed cache is refilled from the primary only, so a lagging replica
+    can't cache a page from before the write that invalidated it.
+    """
+    if not published_only:
+        page = await service.get_posts(db, pagination, published_only=False)
+        return Response(content=service.serialize_posts_page(page), media_type="application/json")
+    
+    # The public feed is identical for every caller, so serve it cached with an ETag
+    cached_page = await service.get_published_feed(pagination)
+    headers = {"ETag": cached_page.etag, "Cache-Control": "public, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), cached_page.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached_page.body, media_type="application/json", headers=headers)
 
 
 @router.get("/me", response_model=PaginatedResponse[schemas.PostListResponse])
 async def list_my_posts(
     pagination: PaginationParams = Depends(),
     current_user: auth_schemas.UserResponse = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get current user's posts."""
-    return service.get_posts(db, pagination, author_id=current_user.id, published_only=False)
+    page = await service.get_posts(db, pagination, author_id=current_user.id, published_only=False)
+    return Response(content=service.serialize_posts_page(page), media_type="application/json")
 
 
 @router.post("/", response_model=schemas.PostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
     post: schemas.PostCreate,
     current_user: auth_schemas.UserResponse = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new post."""
-    return service.create_post(db, post, current_user.id)
+    return await service.create_post(db, post, current_user.id)
 
 
 @router.get("/{post_id}", response_model=schemas.PostResponse)
 async def get_post(
-    post: models.Post = Depends(dependencies.get_post_or_404)
+    post: models.Post = Depends(dependencies.get_read_post_or_404)
 ):
     """Get a post by ID."""
     return schemas.PostResponse.model_validate(post)
@@ -52,20 +68,18 @@ async def get_post(
 async def update_post(
     post_update: schemas.PostUpdate,
     post: models.Post = Depends(dependencies.verify_post_owner),
-    current_user: auth_schemas.UserResponse = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a post."""
-    return service.update_post(db, post.id, post_update, current_user.id, current_user.is_superuser)
+    return await service.update_post(db, post, post_update)
 
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post(
     post: models.Post = Depends(dependencies.verify_post_owner),
-    current_user: auth_schemas.UserResponse = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a post."""
-    service.delete_post(db, post.id, current_user.id, current_user.is_superuser)
+    await service.delete_post(db, post)
     return None
 
@@ -1,50 +1,131 @@
 """Posts service layer."""
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from src.posts import models, schemas, exceptions
+from typing import Optional
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, literal, select, tuple_
+from sqlalchemy.orm import undefer
+from src.cache import TTLCache
+from src.database import AsyncSessionLocal
+from src.posts import models, schemas
+from src.posts.cache import CachedPage, feed_cache
+from src.posts.config import POST_COUNT_CACHE_TTL_SECONDS, POST_COUNT_CACHE_MAX_SIZE
 from src.posts.constants import POST_STATUS_PUBLISHED
-from src.pagination import PaginationParams, PaginatedResponse
+from src.pagination import PaginationParams, PaginatedResponse, count_total, encode_cursor, decode_cursor
 
+# Post counts keyed by (author_id, published_only), used when counts are cached
+count_cache = TTLCache(maxsize=POST_COUNT_CACHE_MAX_SIZE, ttl=POST_COUNT_CACHE_TTL_SECONDS)
 
-def get_post_by_id(db: Session, post_id: int) -> Optional[models.Post]:
+
+async def get_post_by_id(db: AsyncSession, post_id: int) -> Optional[models.Post]:
     """Get post by ID."""
-    return db.query(models.Post).filter(models.Post.id == post_id).first()
+    result = await db.execute(
+        select(models.Post).options(undefer(models.Post.content)).where(models.Post.id == post_id)
+    )
+    return result.scalars().first()
 
 
-def get_posts(
-    db: Session,
-    pagination: PaginationParams,
-    author_id: Optional[int] = None,
-    published_only: bool = False
-) -> PaginatedResponse[schemas.PostListResponse]:
-    """Get paginated list of posts."""
-    query = db.query(models.Post)
+# Columns returned by list endpoints, selected as plain rows instead of ORM objects
+LIST_COLUMNS = [getattr(models.Post, field) for field in schemas.PostListResponse.model_fields]
+
+# Page type for post listings, with its JSON serializer compiled once at import
+PostListPage = PaginatedResponse[schemas.PostListResponse]
+post_list_page_adapter = TypeAdapter(PostListPage)
+
+
+def build_posts_query(author_id: Optional[int] = None, published_only: bool = False) -> Select:
+    """Build the filtered post listing query, without ordering or paging."""
+    query = select(*LIST_COLUMNS)
     
     if author_id:
-        query = query.filter(models.Post.author_id == author_id)
+        query = query.where(models.Post.author_id == author_id)
     
     if published_only:
-        query = query.filter(
+        # Inline literals so the planner can match the partial published-posts index
+        query = query.where(
             models.Post.is_published == True,
-            models.Post.status == POST_STATUS_PUBLISHED
+            models.Post.status == literal(POST_STATUS_PUBLISHED, literal_execute=True)
+        )
+    
+    return query
+
+
+def paginate_posts_query(query: Select, pagination: PaginationParams) -> Select:
+    """Apply listing order and offset or keyset paging, fetching one extra row."""
+    # The id tie-breaker keeps the order total so cursors never skip or repeat rows
+    query = query.order_by(models.Post.created_at.desc(), models.Post.id.desc())
+    if pagination.cursor:
+        created_at, post_id = decode_cursor(pagination.cursor)
+        # Row-value comparison, so the planner seeks the listing index instead of scanning
+        query = query.where(
+            tuple_(models.Post.created_at, models.Post.id) < (created_at, post_id)
         )
+    else:
+        query = query.offset(pagination.skip)
+    
+    # The extra row tells whether another page follows
+    return query.limit(pagination.limit + 1)
+
+
+async def get_posts(
+    db: AsyncSession,
+    pagination: PaginationParams,
+    author_id: Optional[int] = None,
+    published_only: bool = False
+) -> PaginatedResponse[schemas.PostListResponse]:
+    """Get paginated list of posts."""
+    query = build_posts_query(author_id, published_only)
     
     # Get total count
-    total = query.count()
+    total, total_is_estimate = None, False
+    if pagination.include_total:
+        is_filtered = author_id is not None or published_only
+        total, total_is_estimate = await count_total(
+            db,
+            query,
+            cache=count_cache,
+            cache_key=(author_id, published_only),
+            estimate_table=None if is_filtered else models.Post.__tablename__
+        )
     
-    # Apply pagination
-    posts = query.order_by(models.Post.created_at.desc()).offset(pagination.skip).limit(pagination.limit).all()
+    # Apply pagination: keyset when a cursor is given, offset otherwise
+    result = await db.execute(paginate_posts_query(query, pagination))
+    rows = result.all()
+    has_more = len(rows) > pagination.limit
+    rows = rows[:pagination.limit]
+    next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None
     
-    return PaginatedResponse.create(
-        items=[schemas.PostListResponse.model_validate(post) for post in posts],
+    # Plain dicts let pydantic-core validate the whole page in a single pass
+    return PostListPage.create(
+        items=[row._asdict() for row in rows],
         total=total,
         page=pagination.page,
-        page_size=pagination.page_size
+        page_size=pagination.page_size,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate
     )
 
 
-def create_post(db: Session, post: schemas.PostCreate, author_id: int) -> models.Post:
+def serialize_posts_page(page: PostListPage) -> bytes:
+    """Serialize a page built by get_posts straight to JSON bytes."""
+    return post_list_page_adapter.dump_json(page)
+
+
+async def get_published_feed(pagination: PaginationParams) -> CachedPage:
+    """
+    Get a serialized page of the public feed, served from the feed cache when possible.
+    Misses are read through a primary session opened just for the refill, since the
+    page is cached for every client.
+    """
+    key = await feed_cache.key(pagination)
+    page = await feed_cache.get(key)
+    if page is None:
+        async with AsyncSessionLocal() as db:
+            response = await get_posts(db, pagination, published_only=True)
+        page = await feed_cache.set(key, serialize_posts_page(response))
+    return page
+
+
+async def create_post(db: AsyncSession, post: schemas.PostCreate, author_id: int) -> models.Post:
     """Create a new post."""
     db_post = models.Post(
         title=post.title,
@@ -54,27 +135,22 @@ def create_post(db: Session, post: schemas.PostCreate, author_id: int) -> models
         is_published=(post.status == POST_STATUS_PUBLISHED)
     )
     db.add(db_post)
-    db.commit()
-    db.refresh(db_post)
+    await db.commit()
+    count_cache.clear()
+    await feed_cache.invalidate()
     return db_post
 
 
-def update_post(
-    db: Session,
-    post_id: int,
-    post_update: schemas.PostUpdate,
-    author_id: int,
-    is_admin: bool = False
+async def update_post(
+    db: AsyncSession,
+    db_post: models.Post,
+    post_update: schemas.PostUpdate
 ) -> models.Post:
-    """Update a post."""
-    db_post = get_post_by_id(db, post_id)
-    if not db_post:
-        raise exceptions.PostNotFoundError()
-    
-    # Check ownership
-    if db_post.author_id != author_id and not is_admin:
-        raise exceptions.UnauthorizedPostAccessError()
-    
+    """
+    Update a post.
+    The post must already be loaded and authorized (see dependencies.verify_post_owner),
+    so this issues a single UPDATE.
+    """
     # Update fields
     if post_update.title is not None:
         db_post.title = post_update.title
@@ -85,22 +161,21 @@ def update_post(
     if post_update.is_published is not None:
         db_post.is_published = post_update.is_published
     
-    db.commit()
-    db.refresh(db_post)
+    await db.commit()
+    if post_update.status is not None or post_update.is_published is not None:
+        count_cache.clear()
+    await feed_cache.invalidate()
     return db_post
 
 
-def delete_post(db: Session, post_id: int, author_id: int, is_admin: bool = False) -> bool:
-    """Delete a post."""
-    db_post = get_post_by_id(db, post_id)
-    if not db_post:
-        raise exceptions.PostNotFoundError()
-    
-    # Check ownership
-    if db_post.author_id != author_id and not is_admin:
-        raise exceptions.UnauthorizedPostAccessError()
-    
-    db.delete(db_post)
-    db.commit()
+async def delete_post(db: AsyncSession, db_post: models.Post) -> bool:
+    """
+    Delete a post.
+    The post must already be loaded and authorized (see dependencies.verify_post_owner),
+    so this issues a single DELETE.
+    """
+    await db.delete(db_post)
+    await db.commit()
+    count_cache.clear()
+    await feed_cache.invalidate()
     return True
-
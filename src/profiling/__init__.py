@@ -0,0 +1,2 @@
+"""Profiling module."""
+
@@ -0,0 +1,8 @@
+"""Profiling module configuration."""
+from src.config import settings
+
+PROFILING_ENABLED = settings.PROFILING_ENABLED
+PROFILING_SAMPLE_RATE = settings.PROFILING_SAMPLE_RATE
+PROFILING_SECRET = settings.PROFILING_SECRET
+PROFILING_DIR = settings.PROFILING_DIR
+PROFILING_MAX_REPORTS = settings.PROFILING_MAX_REPORTS
@@ -0,0 +1,12 @@
+"""Profiling module constants."""
+
+# Request header that asks for a profile of that request
+PROFILE_REQUEST_HEADER = "x-profile"
+# Response header carrying the id of the report written for the request
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+# Functions shown in the text report
+REPORT_TOP_FUNCTIONS = 40
+
+# Error messages
+ERROR_PROFILE_NOT_FOUND = "Profile not found"
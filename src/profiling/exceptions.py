@@ -0,0 +1,9 @@
+"""Profiling module exceptions."""
+from src.exceptions import NotFoundError
+from src.profiling.constants import ERROR_PROFILE_NOT_FOUND
+
+
+class ProfileNotFoundError(NotFoundError):
+    """Profile not found exception."""
+    def __init__(self, message: str = ERROR_PROFILE_NOT_FOUND):
+        super().__init__(message)
@@ -0,0 +1,213 @@
+"""Per-request cProfile sessions and reports."""
+import cProfile
+import hmac
+import io
+import json
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+from src.profiling import schemas
+from src.profiling.config import (
+    PROFILING_ENABLED,
+    PROFILING_SAMPLE_RATE,
+    PROFILING_SECRET,
+    PROFILING_DIR,
+    PROFILING_MAX_REPORTS
+)
+from src.profiling.constants import REPORT_TOP_FUNCTIONS
+from src.profiling.exceptions import ProfileNotFoundError
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROFILE_ID_PATTERN = re.compile(r"^\d{8}T\d{12}-[0-9a-f]{8}$")
+
+# Self time goes to the first category whose marker is in the function's file
+# path, or in its name for C functions such as pydantic-core validators
+CATEGORIES = (
+    ("database", ("sqlalchemy", "asyncpg", "aiosqlite", "psycopg2", "sqlite3")),
+    ("validation", ("pydantic",)),
+    ("auth", ("bcrypt", "jose")),
+    ("framework", ("fastapi", "starlette", "anyio", "uvicorn")),
+)
+
+
+def categorize(filename: str, function_name: str) -> str:
+    """Get the category a profiled function's self time belongs to."""
+    if filename.startswith(SRC_DIR):
+        return "application"
+    haystack = function_name if filename == "~" else filename
+    for category, markers in CATEGORIES:
+        if any(marker in haystack for marker in markers):
+            return category
+    return "other"
+
+
+class ProfileSession:
+    """A running profile of one request."""
+
+    def __init__(self):
+        self.created_at = datetime.now(timezone.utc)
+        self.profile_id = f"{self.created_at:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}"
+        self.profile = cProfile.Profile()
+        self.started_at = time.perf_counter()
+        self.duration = 0.0
+
+
+class RequestProfiler:
+    """
+    Profile sampled or explicitly requested requests and store their reports.
+    cProfile hooks the whole event loop thread, so only one request per worker is
+    profiled at a time, and other tasks running meanwhile appear in its report.
+    Work in thread pools (bcrypt, aiosqlite, boto3) shows up only as waiting.
+    Profiling slows a request down a lot, so the X-Profile header is honoured only
+    when it carries the shared secret; without one, only sampling applies.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = PROFILING_ENABLED,
+        sample_rate: float = PROFILING_SAMPLE_RATE,
+        secret: Optional[str] = PROFILING_SECRET,
+        directory: str = PROFILING_DIR,
+        max_reports: int = PROFILING_MAX_REPORTS
+    ):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.secret = secret
+        self.directory = directory
+        self.max_reports = max_reports
+        self._lock = threading.Lock()
+        self._active = False
+
+    def should_profile(self, header_value: Optional[str]) -> bool:
+        """Check if a request is sampled or asked for a profile with the shared secret."""
+        if not self.enabled:
+            return False
+        if header_value and self.secret and hmac.compare_digest(header_value.encode(), self.secret.encode()):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start(self) -> Optional[ProfileSession]:
+        """Start profiling, or return None if another request is being profiled."""
+        with self._lock:
+            if self._active:
+                return None
+            self._active = True
+        session = ProfileSession()
+        session.profile.enable()
+        return session
+
+    def stop(self, session: ProfileSession) -> None:
+        """Stop profiling, freeing the profiler for the next request."""
+        session.profile.disable()
+        session.duration = time.perf_counter() - session.started_at
+        with self._lock:
+            self._active = False
+
+    def _path(self, profile_id: str, extension: str) -> str:
+        """Get a report file path, rejecting ids that could escape the directory."""
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            raise ProfileNotFoundError()
+        return os.path.join(self.directory, f"{profile_id}.{extension}")
+
+    def write_report(
+        self,
+        session: ProfileSession,
+        method: str,
+        path: str,
+        route: Optional[str],
+        status_code: int
+    ) -> schemas.ProfileSummary:
+        """Write the text report, raw pstats and summary for a finished session."""
+        stream = io.StringIO()
+        stats = pstats.Stats(session.profile, stream=stream)
+
+        categories: dict[str, float] = {}
+        for (filename, _, function_name), (_, _, self_time, _, _) in stats.stats.items():
+            category = categorize(filename, function_name)
+            categories[category] = categories.get(category, 0.0) + self_time
+        profiled = sum(categories.values()) or 1.0
+
+        summary = schemas.ProfileSummary(
+            profile_id=session.profile_id,
+            method=method,
+            path=path,
+            route=route,
+            status_code=status_code,
+            duration_ms=round(session.duration * 1000, 3),
+            created_at=session.created_at,
+            categories_ms={name: round(seconds * 1000, 3) for name, seconds in categories.items()},
+        )
+
+        stream.write(f"{method} {path} (route {route or '-'}) -> {status_code} in {summary.duration_ms:.2f} ms\n\n")
+        stream.write("Self time by category (event loop thread only):\n")
+        for name, seconds in sorted(categories.items(), key=lambda item: item[1], reverse=True):
+            stream.write(f"  {name:<12} {seconds * 1000:10.2f} ms {seconds / profiled * 100:6.1f}%\n")
+        stream.write("\n")
+        stats.sort_stats("cumulative").print_stats(REPORT_TOP_FUNCTIONS)
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(session.profile_id, "txt"), "w") as report_file:
+            report_file.write(stream.getvalue())
+        stats.dump_stats(self._path(session.profile_id, "prof"))
+        with open(self._path(session.profile_id, "json"), "w") as summary_file:
+            summary_file.write(summary.model_dump_json())
+
+        self._prune()
+        return summary
+
+    def _prune(self) -> None:
+        """Delete the oldest reports beyond max_reports."""
+        profile_ids = self._profile_ids()
+        for profile_id in profile_ids[:max(0, len(profile_ids) - self.max_reports)]:
+            for extension in ("json", "txt", "prof"):
+                try:
+                    os.remove(self._path(profile_id, extension))
+                except FileNotFoundError:
+                    pass
+
+    def _profile_ids(self) -> list[str]:
+        """Get stored profile ids, oldest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            name[:-len(".json")]
+            for name in os.listdir(self.directory)
+            if name.endswith(".json") and PROFILE_ID_PATTERN.match(name[:-len(".json")])
+        )
+
+    def list_reports(self) -> list[schemas.ProfileSummary]:
+        """Get summaries of stored reports, newest first."""
+        summaries = []
+        for profile_id in reversed(self._profile_ids()):
+            try:
+                with open(self._path(profile_id, "json")) as summary_file:
+                    summaries.append(schemas.ProfileSummary.model_validate(json.load(summary_file)))
+            except FileNotFoundError:
+                continue
+        return summaries
+
+    def get_report(self, profile_id: str) -> str:
+        """Get a text report."""
+        try:
+            with open(self._path(profile_id, "txt")) as report_file:
+                return report_file.read()
+        except FileNotFoundError:
+            raise ProfileNotFoundError()
+
+    def get_pstats_path(self, profile_id: str) -> str:
+        """Get the path of a raw pstats dump, for snakeviz or flame graph tools."""
+        path = self._path(profile_id, "prof")
+        if not os.path.exists(path):
+            raise ProfileNotFoundError()
+        return path
+
+
+# Shared profiler instance
+request_profiler = RequestProfiler()
@@ -0,0 +1,39 @@
+"""Profiling router endpoints."""
+from fastapi import APIRouter, Depends
+from fastapi.responses import FileResponse, PlainTextResponse
+from src.auth.dependencies import get_current_admin_user
+from src.auth import schemas as auth_schemas
+from src.profiling import schemas
+from src.profiling.profiler import request_profiler
+
+router = APIRouter()
+
+
+@router.get("/", response_model=list[schemas.ProfileSummary])
+def list_profiles(
+    current_user: auth_schemas.UserResponse = Depends(get_current_admin_user)
+):
+    """List stored request profiles, newest first."""
+    return request_profiler.list_reports()
+
+
+@router.get("/{profile_id}", response_class=PlainTextResponse)
+def get_profile(
+    profile_id: str,
+    current_user: auth_schemas.UserResponse = Depends(get_current_admin_user)
+):
+    """Get a request profile's text report."""
+    return request_profiler.get_report(profile_id)
+
+
+@router.get("/{profile_id}/pstats")
+def download_profile_stats(
+    profile_id: str,
+    current_user: auth_schemas.UserResponse = Depends(get_current_admin_user)
+):
+    """Download a request profile's raw pstats, for snakeviz or flame graph tools."""
+    return FileResponse(
+        request_profiler.get_pstats_path(profile_id),
+        media_type="application/octet-stream",
+        filename=f"{profile_id}.prof"
+    )
@@ -0,0 +1,16 @@
+"""Profiling Pydantic schemas."""
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class ProfileSummary(BaseModel):
+    """Profiled request summary schema."""
+    profile_id: str
+    method: str
+    path: str
+    route: Optional[str] = None
+    status_code: int
+    duration_ms: float
+    created_at: datetime
+    categories_ms: dict[str, float]
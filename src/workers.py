@@ -0,0 +1,17 @@
+"""Gunicorn worker classes."""
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+from src.logging_config import route_uvicorn_logs_to_root
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """
+    Uvicorn worker pinned to uvloop and httptools, failing fast if they're missing.
+    Uvicorn's access log is off; AccessLogMiddleware writes structured access records.
+    """
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on", "access_log": False}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The base class points uvicorn.error at gunicorn's synchronous handlers. With
+        # preload_app that happens after the app configured logging, so undo it here.
+        route_uvicorn_logs_to_root()
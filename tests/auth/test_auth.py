@@ -105,3 +105,168 @@ def test_get_current_user():
     assert response.status_code == 200
     assert response.json()["email"] == email
 
+
+def test_password_hasher_round_trip():
+    """Test hashing and verification through the worker pool."""
+    import asyncio
+    from src.auth.hashing import PasswordHasher
+    from src.metrics import PASSWORD_HASHER_QUEUE_WAIT_SECONDS, PASSWORD_HASHER_RUN_SECONDS
+    
+    hasher = PasswordHasher(max_workers=2, max_queue=2)
+    waits = PASSWORD_HASHER_QUEUE_WAIT_SECONDS.get_count(operation="verify")
+    runs = PASSWORD_HASHER_RUN_SECONDS.get_count(operation="hash")
+    try:
+        hashed = asyncio.run(hasher.hash("testpassword123"))
+        assert asyncio.run(hasher.verify("testpassword123", hashed))
+        assert not asyncio.run(hasher.verify("wrongpassword", hashed))
+        assert hasher.stats()["completed"] == 3
+        # Timings are exported to /metrics too
+        assert PASSWORD_HASHER_QUEUE_WAIT_SECONDS.get_count(operation="verify") == waits + 2
+        assert PASSWORD_HASHER_RUN_SECONDS.get_count(operation="hash") == runs + 1
+    finally:
+        hasher.shutdown()
+
+
+def test_password_hasher_rejects_when_saturated():
+    """Test the worker pool rejects work beyond its queue limit."""
+    import asyncio
+    from src.auth.exceptions import PasswordHasherBusyError
+    from src.auth.hashing import PasswordHasher
+    from src.metrics import PASSWORD_HASHER_REJECTED_TOTAL
+    
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+    rejected = PASSWORD_HASHER_REJECTED_TOTAL.get()
+    
+    async def hash_concurrently():
+        return await asyncio.gather(
+            hasher.hash("testpassword123"),
+            hasher.hash("testpassword123"),
+            return_exceptions=True
+        )
+    
+    try:
+        results = asyncio.run(hash_concurrently())
+        assert isinstance(results[1], PasswordHasherBusyError)
+        assert hasher.stats()["rejected"] == 1
+        assert PASSWORD_HASHER_REJECTED_TOTAL.get() == rejected + 1
+    finally:
+        hasher.shutdown()
+
+
+def test_password_hasher_counts_cancelled_jobs_until_done():
+    """Test a cancelled caller's job keeps its slot until the thread finishes it."""
+    import asyncio
+    from src.auth.hashing import PasswordHasher
+    
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+    
+    async def cancel_hash():
+        task = asyncio.create_task(hasher.hash("testpassword123"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return hasher.stats()["pending"]
+    
+    try:
+        assert asyncio.run(cancel_hash()) == 1
+        hasher.shutdown()
+        assert hasher.stats()["pending"] == 0
+    finally:
+        hasher.shutdown()
+
+
+def test_current_user_is_cached():
+    """Test repeated authenticated requests reuse the cached user snapshot."""
+    import asyncio
+    from src.auth import service
+    from src.database import AsyncSessionLocal
+    
+    timestamp = int(time.time() * 1000)
+    email = f"cache{timestamp}@example.com"
+    register_response = client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": email,
+            "username": f"cacheuser{timestamp}",
+            "password": "testpassword123"
+        }
+    )
+    user_id = register_response.json()["id"]
+    login_response = client.post(
+        "/api/v1/auth/login",
+        json={"email": email, "password": "testpassword123"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    
+    client.get("/api/v1/auth/me", headers=headers)
+    hits = service.user_cache.stats()["hits"]
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+    assert service.user_cache.stats()["hits"] == hits + 1
+    
+    # Deactivating the user drops the cached snapshot
+    async def deactivate():
+        async with AsyncSessionLocal() as db:
+            await service.deactivate_user(db, user_id)
+    
+    asyncio.run(deactivate())
+    assert service.user_cache.get(user_id) is None
+    response = client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 400
+
+
+def test_decode_access_token_is_cached():
+    """Test verified token claims are cached until the token expires."""
+    from datetime import timedelta
+    from src.auth import utils
+    
+    token = utils.create_access_token(
+        data={"sub": "decode@example.com", "user_id": 1},
+        expires_delta=timedelta(minutes=5)
+    )
+    hits = utils.token_cache.stats()["hits"]
+    first = utils.decode_access_token(token)
+    second = utils.decode_access_token(token)
+    assert first == second
+    assert first["sub"] == "decode@example.com"
+    assert utils.token_cache.stats()["hits"] == hits + 1
+    
+    # Callers get their own copy of the cached claims
+    second["sub"] = "changed@example.com"
+    assert utils.decode_access_token(token)["sub"] == "decode@example.com"
+
+
+def test_decode_access_token_rejects_expired_token():
+    """Test expired tokens are rejected and never served from cache."""
+    from datetime import timedelta
+    from src.auth import utils
+    from src.auth.exceptions import TokenExpiredError
+    
+    token = utils.create_access_token(
+        data={"sub": "expired@example.com", "user_id": 1},
+        expires_delta=timedelta(seconds=-1)
+    )
+    with pytest.raises(TokenExpiredError):
+        utils.decode_access_token(token)
+    with pytest.raises(TokenExpiredError):
+        utils.decode_access_token(token)
+
+
+def test_auth_query_budgets(query_budget):
+    """Test auth routes stay within their query budgets."""
+    timestamp = int(time.time() * 1000)
+    email = f"budget{timestamp}@example.com"
+    
+    response = client.post(
+        "/api/v1/auth/register",
+        json={"email": email, "username": f"budget{timestamp}", "password": "testpassword123"}
+    )
+    query_budget(response, 5)
+    
+    response = client.post("/api/v1/auth/login", json={"email": email, "password": "testpassword123"})
+    query_budget(response, 1)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    
+    query_budget(client.get("/api/v1/auth/me", headers=headers), 1)
+    # The user snapshot is cached after the first lookup
+    query_budget(client.get("/api/v1/auth/me", headers=headers), 0)
@@ -1,9 +1,24 @@
 """AWS module tests."""
+import io
+import tempfile
 import pytest
+from moto import mock_s3
 from src.aws.client import S3Client
+from src.aws.constants import DEFAULT_BUCKET_NAME
 from src.aws.exceptions import AWSConnectionError
 
 
+@pytest.fixture
+def s3(monkeypatch):
+    """S3 client backed by moto's in-memory S3 with the default bucket created."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_s3():
+        client = S3Client()
+        client.s3_client.create_bucket(Bucket=DEFAULT_BUCKET_NAME)
+        yield client
+
+
 def test_s3_client_initialization():
     """Test S3 client initialization."""
     # This is a placeholder test
@@ -36,3 +51,382 @@ def test_validate_file_size():
     with pytest.raises(FileTooLargeError):
         validate_file_size(20 * 1024 * 1024)  # 20MB
 
+
+def test_upload_streams_spooled_file(s3):
+    """Test uploads read from a spooled temporary file, as FastAPI's UploadFile provides."""
+    payload = b"x" * (256 * 1024)
+    with tempfile.SpooledTemporaryFile(max_size=1024) as spooled:
+        spooled.write(payload)
+        spooled.seek(0)
+        s3.upload_file(spooled, "uploads/spooled.bin", content_type="application/pdf")
+    
+    head = s3.s3_client.head_object(Bucket=DEFAULT_BUCKET_NAME, Key="uploads/spooled.bin")
+    assert head["ContentLength"] == len(payload)
+    assert head["ContentType"] == "application/pdf"
+
+
+def test_open_stream_in_chunks(s3):
+    """Test downloads are yielded in chunks and honour byte ranges."""
+    payload = bytes(range(256)) * 1024
+    s3.upload_file(io.BytesIO(payload), "downloads/file.bin")
+    
+    stream = s3.open_stream("downloads/file.bin", chunk_size=64 * 1024)
+    chunks = list(stream)
+    assert len(chunks) == 4
+    assert b"".join(chunks) == payload
+    assert stream.content_range is None
+    
+    stream = s3.open_stream("downloads/file.bin", byte_range="bytes=100-199")
+    assert b"".join(stream) == payload[100:200]
+    assert stream.content_range == f"bytes 100-199/{len(payload)}"
+
+
+def test_parse_range_header():
+    """Test Range header validation."""
+    from src.aws.utils import parse_range_header
+    from src.aws.exceptions import InvalidRangeError
+    
+    assert parse_range_header(None) is None
+    assert parse_range_header("bytes=0-99") == "bytes=0-99"
+    assert parse_range_header("bytes=-500") == "bytes=-500"
+    for invalid in ["bytes=-", "bytes=10-5", "items=0-1", "bytes=0-1,5-6"]:
+        with pytest.raises(InvalidRangeError):
+            parse_range_header(invalid)
+
+
+def test_s3_client_is_created_lazily(monkeypatch):
+    """Test the shared clients are built on first use, not at import."""
+    from src.aws import client as client_module
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    client_module.get_s3_client.cache_clear()
+    client_module.get_async_s3_client.cache_clear()
+    
+    assert client_module.get_s3_client.cache_info().currsize == 0
+    async_client = client_module.get_async_s3_client()
+    assert async_client.client is client_module.get_s3_client()
+    assert client_module.get_async_s3_client() is async_client
+    
+    config = async_client.client.s3_client.meta.config
+    assert config.max_pool_connections == client_module.S3_MAX_POOL_CONNECTIONS
+    assert config.retries["mode"] == client_module.S3_RETRY_MODE
+
+
+def test_async_s3_client_round_trip(s3):
+    """Test the async client uploads, streams and deletes without blocking the loop."""
+    import asyncio
+    from src.aws.client import AsyncS3Client
+    
+    async_client = AsyncS3Client(s3, max_workers=4)
+    payload = b"a" * 1000
+    
+    async def run():
+        await asyncio.gather(*[
+            async_client.upload_file(io.BytesIO(payload), f"async/{i}.bin")
+            for i in range(8)
+        ])
+        chunks = [chunk async for chunk in async_client.iter_file("async/3.bin", chunk_size=256)]
+        deleted = await async_client.delete_file("async/3.bin")
+        return chunks, deleted
+    
+    try:
+        chunks, deleted = asyncio.run(run())
+    finally:
+        async_client.shutdown()
+    assert b"".join(chunks) == payload
+    assert len(chunks) == 4
+    assert deleted is True
+
+
+def test_delete_files_batches_keys(s3):
+    """Test delete_files removes keys in DeleteObjects batches of 1000."""
+    keys = [f"bulk/{i}.txt" for i in range(1005)]
+    for key in keys:
+        s3.s3_client.put_object(Bucket=DEFAULT_BUCKET_NAME, Key=key, Body=b"x")
+    
+    calls = []
+    original = s3.s3_client.delete_objects
+    
+    def delete_objects(**kwargs):
+        calls.append(len(kwargs["Delete"]["Objects"]))
+        return original(**kwargs)
+    
+    s3.s3_client.delete_objects = delete_objects
+    results = s3.delete_files(keys + keys[:3])
+    
+    assert calls == [1000, 5]
+    assert [result.file_key for result in results] == keys
+    assert all(result.success for result in results)
+    assert s3.s3_client.list_objects_v2(Bucket=DEFAULT_BUCKET_NAME).get("KeyCount") == 0
+
+
+def test_delete_files_reports_per_key_errors(s3):
+    """Test a failed DeleteObjects request marks each of its keys as failed."""
+    results = s3.delete_files(["a.txt", "b.txt"], bucket_name="missing-bucket")
+    assert [result.success for result in results] == [False, False]
+    assert all(result.error for result in results)
+
+
+def test_upload_files_in_parallel(s3):
+    """Test upload_files uploads every item and reports per-key results."""
+    from src.aws.client import S3UploadItem
+    items = [S3UploadItem(io.BytesIO(f"file {i}".encode()), f"batch/{i}.txt", "text/plain") for i in range(10)]
+    results = s3.upload_files(items, max_concurrency=4)
+    
+    assert [result.file_key for result in results] == [item.file_key for item in items]
+    assert all(result.success and result.url for result in results)
+    body = s3.s3_client.get_object(Bucket=DEFAULT_BUCKET_NAME, Key="batch/7.txt")["Body"].read()
+    assert body == b"file 7"
+    
+    failed = s3.upload_files([S3UploadItem(io.BytesIO(b"x"), "x.txt")], bucket_name="missing-bucket")
+    assert failed[0].success is False
+    assert failed[0].error
+
+
+def test_async_upload_files_share_the_client_pool(s3, monkeypatch):
+    """Test async batch uploads run on the client's own pool, bounded by max_concurrency."""
+    import asyncio
+    import threading
+    import time
+    from src.aws.client import AsyncS3Client, S3UploadItem
+    
+    upload_item = s3.upload_item
+    lock = threading.Lock()
+    threads = set()
+    running = peak = 0
+    
+    def tracked_upload_item(*args, **kwargs):
+        nonlocal running, peak
+        with lock:
+            threads.add(threading.current_thread().name)
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        try:
+            return upload_item(*args, **kwargs)
+        finally:
+            with lock:
+                running -= 1
+    
+    monkeypatch.setattr(s3, "upload_item", tracked_upload_item)
+    async_client = AsyncS3Client(s3, max_workers=8)
+    items = [S3UploadItem(io.BytesIO(f"file {i}".encode()), f"batch/{i}.txt", "text/plain") for i in range(10)]
+    try:
+        results = asyncio.run(async_client.upload_files(items, max_concurrency=3))
+    finally:
+        async_client.shutdown()
+    
+    assert [result.file_key for result in results] == [item.file_key for item in items]
+    assert all(result.success for result in results)
+    assert all(name.startswith("s3_") for name in threads)
+    assert peak <= 3
+
+
+def test_generate_presigned_urls(s3):
+    """Test batch presigning returns one URL per key, in order."""
+    results = s3.generate_presigned_urls(["a.jpg", "b.jpg"], expiration=60)
+    assert [result.file_key for result in results] == ["a.jpg", "b.jpg"]
+    assert all(result.success for result in results)
+    assert "a.jpg" in results[0].url and "b.jpg" in results[1].url
+
+
+def test_presigned_urls_are_cached(s3):
+    """Test presigned URLs are reused until too little of their lifetime is left."""
+    from src.aws.schemas import PresignedURLRequest
+    
+    first = s3.generate_presigned_url("photo.jpg", expiration=600)
+    assert s3.generate_presigned_url("photo.jpg", expiration=600) == first
+    assert s3.presigned_url_cache.stats()["hits"] == 1
+    
+    # A different expiration is a different URL
+    assert s3.generate_presigned_url("photo.jpg", expiration=300) != first
+    
+    response = s3.get_presigned_url(PresignedURLRequest(file_key="photo.jpg", expiration=600))
+    assert response.url == first
+    assert 0 < response.expires_in <= 600
+    
+    # Nothing is reused once the remaining-lifetime threshold is the whole lifetime
+    s3.presigned_url_cache.clear()
+    s3.presigned_url_min_remaining = 1.0
+    s3.generate_presigned_url("photo.jpg", expiration=600)
+    assert len(s3.presigned_url_cache) == 0
+
+
+def test_direct_upload_flow(s3):
+    """Test a presigned POST upload goes straight to S3 and is confirmed by the API."""
+    import time
+    import requests
+    from fastapi.testclient import TestClient
+    from src.main import app
+    from src.aws.client import AsyncS3Client, get_async_s3_client
+    
+    client = TestClient(app)
+    async_client = AsyncS3Client(s3, max_workers=2)
+    app.dependency_overrides[get_async_s3_client] = lambda: async_client
+    try:
+        timestamp = int(time.time() * 1000)
+        email = f"uploader{timestamp}@example.com"
+        client.post(
+            "/api/v1/auth/register",
+            json={"email": email, "username": f"uploader{timestamp}", "password": "testpassword123"}
+        )
+        token = client.post(
+            "/api/v1/auth/login",
+            json={"email": email, "password": "testpassword123"}
+        ).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        payload = b"%PDF-1.4 test"
+        response = client.post(
+            "/api/v1/files/uploads",
+            json={"filename": "../report.pdf", "content_type": "application/pdf", "file_size": len(payload)},
+            headers=headers
+        )
+        assert response.status_code == 201
+        upload = response.json()
+        assert upload["fields"]["Content-Type"] == "application/pdf"
+        assert ".." not in upload["file_key"]
+        
+        # Completing before the upload finds nothing
+        response = client.post("/api/v1/files/uploads/complete", json={"file_key": upload["file_key"]}, headers=headers)
+        assert response.status_code == 404
+        
+        # The client posts the bytes to S3 directly
+        s3_response = requests.post(upload["url"], data=upload["fields"], files={"file": ("report.pdf", payload)})
+        assert s3_response.status_code in (200, 204)
+        
+        response = client.post("/api/v1/files/uploads/complete", json={"file_key": upload["file_key"]}, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["file_key"] == upload["file_key"]
+        
+        # Another user's keys are off limits
+        response = client.post("/api/v1/files/uploads/complete", json={"file_key": "uploads/0/x.pdf"}, headers=headers)
+        assert response.status_code == 403
+        
+        response = client.post(
+            "/api/v1/files/uploads",
+            json={"filename": "run.exe", "content_type": "application/x-executable", "file_size": 10},
+            headers=headers
+        )
+        assert response.status_code == 400
+    finally:
+        app.dependency_overrides.pop(get_async_s3_client, None)
+        async_client.shutdown()
+
+
+def test_download_streams_user_files(s3, monkeypatch):
+    """Test downloads stream the user's own files, whole or by byte range, read on the S3 pool."""
+    import threading
+    import time
+    from fastapi.testclient import TestClient
+    from src.main import app
+    from src.aws.client import AsyncS3Client, S3ObjectStream, get_async_s3_client
+    
+    read_threads = set()
+    iter_chunks = S3ObjectStream.__iter__
+    
+    def tracked_iter(stream):
+        for chunk in iter_chunks(stream):
+            read_threads.add(threading.current_thread().name)
+            yield chunk
+    
+    monkeypatch.setattr(S3ObjectStream, "__iter__", tracked_iter)
+    client = TestClient(app)
+    async_client = AsyncS3Client(s3, max_workers=2)
+    app.dependency_overrides[get_async_s3_client] = lambda: async_client
+    try:
+        timestamp = int(time.time() * 1000)
+        email = f"downloader{timestamp}@example.com"
+        user_id = client.post(
+            "/api/v1/auth/register",
+            json={"email": email, "username": f"downloader{timestamp}", "password": "testpassword123"}
+        ).json()["id"]
+        token = client.post(
+            "/api/v1/auth/login",
+            json={"email": email, "password": "testpassword123"}
+        ).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        payload = bytes(range(256)) * 512
+        file_key = f"uploads/{user_id}/report.pdf"
+        s3.upload_file(io.BytesIO(payload), file_key, content_type="application/pdf")
+        
+        response = client.get(f"/api/v1/files/downloads/{file_key}", headers=headers)
+        assert response.status_code == 200
+        assert response.content == payload
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-disposition"] == (
+            "attachment; filename=\"report.pdf\"; filename*=UTF-8''report.pdf"
+        )
+        assert read_threads and all(name.startswith("s3_") for name in read_threads)
+        
+        response = client.get(
+            f"/api/v1/files/downloads/{file_key}",
+            headers={**headers, "Range": "bytes=100-199"}
+        )
+        assert response.status_code == 206
+        assert response.content == payload[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(payload)}"
+        
+        response = client.get(f"/api/v1/files/downloads/{file_key}", headers={**headers, "Range": "bytes=9-1"})
+        assert response.status_code == 416
+        
+        response = client.get(f"/api/v1/files/downloads/uploads/{user_id}/missing.pdf", headers=headers)
+        assert response.status_code == 404
+        
+        # Another user's keys are off limits
+        response = client.get("/api/v1/files/downloads/uploads/0/x.pdf", headers=headers)
+        assert response.status_code == 403
+    finally:
+        app.dependency_overrides.pop(get_async_s3_client, None)
+        async_client.shutdown()
+
+
+def test_download_non_ascii_filename(s3):
+    """Test files uploaded under non-ASCII or quoted names download with a valid Content-Disposition."""
+    import time
+    import requests
+    from urllib.parse import quote
+    from fastapi.testclient import TestClient
+    from src.main import app
+    from src.aws.client import AsyncS3Client, get_async_s3_client
+    
+    client = TestClient(app)
+    async_client = AsyncS3Client(s3, max_workers=2)
+    app.dependency_overrides[get_async_s3_client] = lambda: async_client
+    try:
+        timestamp = int(time.time() * 1000)
+        email = f"unicode{timestamp}@example.com"
+        client.post(
+            "/api/v1/auth/register",
+            json={"email": email, "username": f"unicode{timestamp}", "password": "testpassword123"}
+        )
+        token = client.post(
+            "/api/v1/auth/login",
+            json={"email": email, "password": "testpassword123"}
+        ).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        payload = b"%PDF-1.4 test"
+        filename = '报告 "final".pdf'
+        upload = client.post(
+            "/api/v1/files/uploads",
+            json={"filename": filename, "content_type": "application/pdf", "file_size": len(payload)},
+            headers=headers
+        ).json()
+        s3_response = requests.post(upload["url"], data=upload["fields"], files={"file": ("report.pdf", payload)})
+        assert s3_response.status_code in (200, 204)
+        
+        response = client.get(f"/api/v1/files/downloads/{upload['file_key']}", headers=headers)
+        assert response.status_code == 200
+        assert response.content == payload
+        download_name = upload["file_key"].rsplit("/", 1)[-1]
+        assert download_name.endswith(filename)
+        ascii_name = download_name[:-len(filename)] + '__ \\"final\\".pdf'
+        assert response.headers["content-disposition"] == (
+            f'attachment; filename="{ascii_name}"; filename*=UTF-8\'\'{quote(download_name, safe="")}'
+        )
+    finally:
+        app.dependency_overrides.pop(get_async_s3_client, None)
+        async_client.shutdown()
@@ -0,0 +1,47 @@
+"""Shared test fixtures."""
+import os
+import re
+import pytest
+from sqlalchemy import event
+
+# query_budget reads the Server-Timing header, which is off by default
+os.environ.setdefault("SERVER_TIMING_ENABLED", "true")
+
+import src.main  # noqa: E402,F401  Registers every model on Base.metadata
+from src.database import Base, engine, async_engine  # noqa: E402
+
+SERVER_TIMING_QUERIES = re.compile(r'db;dur=[\d.]+;desc="(\d+) quer')
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables():
+    """Create the schema once; the app leaves schema management to Alembic."""
+    Base.metadata.create_all(bind=engine)
+    yield
+
+
+@pytest.fixture
+def sql_statements():
+    """Record the SQL statements the async engine runs during a test."""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def query_budget():
+    """Fail a test when a response ran more queries than allowed, per its Server-Timing header."""
+    def check(response, max_queries: int) -> int:
+        match = SERVER_TIMING_QUERIES.search(response.headers.get("server-timing", ""))
+        assert match, "response has no Server-Timing db entry"
+        count = int(match.group(1))
+        assert count <= max_queries, (
+            f"{response.request.method} {response.request.url.path} ran {count} queries, budget is {max_queries}"
+        )
+        return count
+    return check
@@ -7,6 +7,25 @@ from src.main import app
 client = TestClient(app)
 
 
+def _auth_headers(prefix: str) -> dict:
+    """Register and login a fresh user, returning auth headers."""
+    timestamp = int(time.time() * 1000)
+    email = f"{prefix}{timestamp}@example.com"
+    client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": email,
+            "username": f"{prefix}{timestamp}",
+            "password": "testpassword123"
+        }
+    )
+    login_response = client.post(
+        "/api/v1/auth/login",
+        json={"email": email, "password": "testpassword123"}
+    )
+    return {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+
 def test_create_post():
     """Test post creation."""
     # Use unique email and username to avoid conflicts
@@ -57,9 +76,167 @@ def test_list_posts():
     assert "items" in response.json()
 
 
+def test_list_posts_etag():
+    """Test the public feed supports conditional requests and sees new posts."""
+    response = client.get("/api/v1/posts/", params={"page_size": 5})
+    etag = response.headers["ETag"]
+    
+    response = client.get("/api/v1/posts/", params={"page_size": 5}, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    
+    # Publishing a post invalidates the cached feed
+    post_id = client.post(
+        "/api/v1/posts/",
+        json={"title": "Feed Post", "content": "Feed content", "status": "published"},
+        headers=_auth_headers("feeduser")
+    ).json()["id"]
+    response = client.get("/api/v1/posts/", params={"page_size": 5}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["items"][0]["id"] == post_id
+
+
+def test_feed_opens_primary_session_only_on_refill(monkeypatch):
+    """Test cached feed pages are served without opening a primary session."""
+    from src.posts import service
+    
+    opened = []
+    session_factory = service.AsyncSessionLocal
+    
+    def tracking_session_factory():
+        opened.append(True)
+        return session_factory()
+    
+    monkeypatch.setattr(service, "AsyncSessionLocal", tracking_session_factory)
+    client.get("/api/v1/posts/", params={"page_size": 3})
+    opened.clear()
+    
+    response = client.get("/api/v1/posts/", params={"page_size": 3})
+    assert response.status_code == 200
+    assert opened == []
+
+
 def test_get_post():
     """Test getting a single post."""
     # This would require creating a post first
     # Placeholder test
     pass
 
+
+def test_update_and_delete_post(sql_statements):
+    """Test update and delete load the post once and issue one write each."""
+    headers = _auth_headers("writeuser")
+    post_id = client.post(
+        "/api/v1/posts/",
+        json={"title": "Write Post", "content": "Write content"},
+        headers=headers
+    ).json()["id"]
+    
+    sql_statements.clear()
+    response = client.put(
+        f"/api/v1/posts/{post_id}",
+        json={"title": "Updated Write Post"},
+        headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json()["title"] == "Updated Write Post"
+    assert response.json()["content"] == "Write content"
+    assert response.json()["updated_at"] is not None
+    assert [s.split()[0] for s in sql_statements] == ["SELECT", "UPDATE"]
+    
+    sql_statements.clear()
+    response = client.delete(f"/api/v1/posts/{post_id}", headers=headers)
+    assert response.status_code == 204
+    assert [s.split()[0] for s in sql_statements] == ["SELECT", "DELETE"]
+    
+    assert client.get(f"/api/v1/posts/{post_id}").status_code == 404
+
+
+def test_list_posts_with_cursor():
+    """Test following next_cursor visits every post exactly once."""
+    headers = _auth_headers("cursoruser")
+    created_ids = []
+    for i in range(5):
+        response = client.post(
+            "/api/v1/posts/",
+            json={"title": f"Cursor Post {i}", "content": "Cursor content"},
+            headers=headers
+        )
+        created_ids.append(response.json()["id"])
+    
+    seen_ids = []
+    params = {"page_size": 2}
+    for _ in range(len(created_ids)):
+        response = client.get("/api/v1/posts/me", params=params, headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        seen_ids.extend(item["id"] for item in body["items"])
+        if body["next_cursor"] is None:
+            break
+        params = {"page_size": 2, "cursor": body["next_cursor"]}
+    
+    assert seen_ids == sorted(created_ids, reverse=True)
+
+
+def test_list_posts_with_invalid_cursor():
+    """Test malformed cursors are rejected."""
+    response = client.get("/api/v1/posts/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_list_posts_without_total():
+    """Test the total can be skipped."""
+    response = client.get("/api/v1/posts/", params={"include_total": False})
+    assert response.status_code == 200
+    assert response.json()["total"] is None
+    assert response.json()["total_pages"] is None
+
+
+def test_list_posts_sql_omits_content(sql_statements):
+    """Test listing queries never select the post content column."""
+    from sqlalchemy import select
+    from src.posts import models
+    
+    # Content is deferred for plain ORM queries too
+    assert "posts.content" not in str(select(models.Post))
+    
+    headers = _auth_headers("projectionuser")
+    client.post(
+        "/api/v1/posts/",
+        json={"title": "Projection Post", "content": "x" * 5000},
+        headers=headers
+    )
+    
+    sql_statements.clear()
+    response = client.get("/api/v1/posts/me", headers=headers)
+    assert response.status_code == 200
+    assert "content" not in response.json()["items"][0]
+    
+    post_queries = [statement for statement in sql_statements if "FROM posts" in statement]
+    assert post_queries
+    assert all("posts.content" not in statement for statement in post_queries)
+
+
+def test_posts_query_budgets(query_budget):
+    """Test post routes stay within their query budgets, whatever the page size."""
+    headers = _auth_headers("postbudget")
+    query_budget(client.get("/api/v1/auth/me", headers=headers), 1)
+    
+    for i in range(3):
+        response = client.post(
+            "/api/v1/posts/",
+            json={"title": f"Budget {i}", "content": "Content", "status": "published"},
+            headers=headers
+        )
+        query_budget(response, 2)
+    post_id = response.json()["id"]
+    
+    # One query for the page and one for the total, never one per post
+    query_budget(client.get("/api/v1/posts/?page_size=50"), 2)
+    query_budget(client.get("/api/v1/posts/?page_size=50&published_only=false"), 2)
+    query_budget(client.get("/api/v1/posts/?published_only=false&include_total=false"), 1)
+    query_budget(client.get("/api/v1/posts/me", headers=headers), 2)
+    query_budget(client.get(f"/api/v1/posts/{post_id}"), 1)
+    query_budget(client.put(f"/api/v1/posts/{post_id}", json={"title": "Updated"}, headers=headers), 2)
+    query_budget(client.delete(f"/api/v1/posts/{post_id}", headers=headers), 2)
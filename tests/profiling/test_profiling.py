@@ -0,0 +1,112 @@
+"""Profiling module tests."""
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.auth.dependencies import get_current_admin_user
+from src.auth.models import User
+from src.database import get_async_db
+from src.main import app
+from src.middleware import ProfilingMiddleware
+from src.posts import schemas as post_schemas
+from src.profiling.profiler import RequestProfiler, categorize, request_profiler
+
+client = TestClient(app)
+
+PROFILE_SECRET = "profile-secret"
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    """Enabled profiler writing to a temporary directory."""
+    return RequestProfiler(enabled=True, sample_rate=0.0, secret=PROFILE_SECRET, directory=str(tmp_path), max_reports=2)
+
+
+def _profiled_app(profiler: RequestProfiler) -> TestClient:
+    """App doing database and validation work behind the profiling middleware."""
+    profiled_app = FastAPI()
+    profiled_app.add_middleware(ProfilingMiddleware, profiler=profiler)
+    
+    @profiled_app.get("/work/{count}")
+    async def work(count: int, db: AsyncSession = Depends(get_async_db)):
+        await db.execute(select(User.id).limit(1))
+        for _ in range(count):
+            post_schemas.PostCreate(title="Title", content="Body")
+        return {"count": count}
+    
+    return TestClient(profiled_app)
+
+
+def test_categorize():
+    """Test functions are attributed by package."""
+    assert categorize(categorize.__code__.co_filename, "categorize") == "application"
+    assert categorize("/venv/site-packages/sqlalchemy/engine/base.py", "execute") == "database"
+    assert categorize("~", "<method 'validate_python' of 'pydantic_core._pydantic_core.SchemaValidator' objects>") == "validation"
+    assert categorize("/usr/lib/python3.11/asyncio/events.py", "_run") == "other"
+
+
+def test_profiling_middleware_writes_reports(profiler):
+    """Test requests with X-Profile are profiled and reports are stored and pruned."""
+    profiled = _profiled_app(profiler)
+    
+    assert "X-Profile-Id" not in profiled.get("/work/10").headers
+    
+    response = profiled.get("/work/200", headers={"X-Profile": PROFILE_SECRET})
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+    
+    [summary] = profiler.list_reports()
+    assert summary.profile_id == profile_id
+    assert summary.route == "/work/{count}"
+    assert summary.status_code == 200
+    assert summary.categories_ms["validation"] > 0
+    assert summary.categories_ms["database"] > 0
+    
+    report = profiler.get_report(profile_id)
+    assert "Self time by category" in report
+    assert "GET /work/200" in report
+    
+    for _ in range(2):
+        profiled.get("/work/1", headers={"X-Profile": PROFILE_SECRET})
+    assert len(profiler.list_reports()) == 2
+    assert profile_id not in [summary.profile_id for summary in profiler.list_reports()]
+
+
+def test_profile_header_requires_secret(profiler, tmp_path):
+    """Test X-Profile is ignored unless it carries the configured secret."""
+    profiled = _profiled_app(profiler)
+    assert "X-Profile-Id" not in profiled.get("/work/1", headers={"X-Profile": "1"}).headers
+    assert "X-Profile-Id" not in profiled.get("/work/1", headers={"X-Profile": "wrong"}).headers
+    assert profiler.list_reports() == []
+    
+    # Without a secret, only sampling can profile a request
+    unkeyed = RequestProfiler(enabled=True, sample_rate=0.0, secret=None, directory=str(tmp_path))
+    assert not unkeyed.should_profile("1")
+    assert not unkeyed.should_profile("")
+
+
+def test_profile_endpoints_require_admin(profiler, monkeypatch):
+    """Test reports are only served to admins."""
+    response = client.get("/api/v1/admin/profiles/")
+    assert response.status_code == 401
+    
+    profile_id = _profiled_app(profiler).get("/work/1", headers={"X-Profile": PROFILE_SECRET}).headers["X-Profile-Id"]
+    monkeypatch.setattr(request_profiler, "directory", profiler.directory)
+    app.dependency_overrides[get_current_admin_user] = lambda: None
+    try:
+        listed = client.get("/api/v1/admin/profiles/").json()
+        assert [summary["profile_id"] for summary in listed] == [profile_id]
+        
+        report = client.get(f"/api/v1/admin/profiles/{profile_id}")
+        assert report.status_code == 200
+        assert report.headers["content-type"].startswith("text/plain")
+        
+        stats = client.get(f"/api/v1/admin/profiles/{profile_id}/pstats")
+        assert stats.status_code == 200
+        assert stats.content
+        
+        assert client.get("/api/v1/admin/profiles/..%2F..%2Fetc").status_code == 404
+        assert client.get("/api/v1/admin/profiles/20000101T000000000000-00000000").status_code == 404
+    finally:
+        app.dependency_overrides.pop(get_current_admin_user, None)
@@ -0,0 +1,98 @@
+"""Cache utility tests."""
+import asyncio
+import time
+from src.cache import RedisCacheBackend, TTLCache, etag_matches, make_etag
+from src.pagination import PaginationParams
+from src.posts.cache import FeedCache
+
+
+def test_ttl_cache_get_and_set():
+    """Test values are returned until they expire."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    
+    cache.set("short", "value", ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test the least recently used entry is evicted first."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_disabled():
+    """Test a zero ttl disables the cache."""
+    cache = TTLCache(maxsize=10, ttl=0)
+    cache.set("key", "value")
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+class FakeRedis:
+    """Local stand-in for the redis.asyncio client."""
+    
+    def __init__(self):
+        self.data = {}
+    
+    async def get(self, key):
+        return self.data.get(key)
+    
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+    
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, b"0")) + 1).encode()
+        return int(self.data[key])
+
+
+def test_feed_cache_with_redis_backend():
+    """Test feed pages are cached and invalidated through a Redis-compatible backend."""
+    cache = FeedCache(RedisCacheBackend(FakeRedis()), ttl=30)
+    pagination = PaginationParams(page=2, page_size=5)
+    
+    async def run():
+        key = await cache.key(pagination)
+        assert await cache.get(key) is None
+        stored = await cache.set(key, b'{"items":[]}')
+        assert await cache.get(key) == stored
+        await cache.invalidate()
+        assert await cache.get(await cache.key(pagination)) is None
+    
+    asyncio.run(run())
+
+
+def test_feed_cache_never_stores_pre_write_pages_as_fresh():
+    """Test a page read before an invalidation stays under the old version's key."""
+    cache = FeedCache(RedisCacheBackend(FakeRedis()), ttl=30)
+    pagination = PaginationParams()
+    
+    async def run():
+        key = await cache.key(pagination)
+        # A write lands between the cache miss and storing the page built before it
+        await cache.invalidate()
+        await cache.set(key, b'{"items":["stale"]}')
+        assert await cache.get(await cache.key(pagination)) is None
+    
+    asyncio.run(run())
+
+
+def test_etag_matches():
+    """Test If-None-Match parsing."""
+    etag = make_etag(b"body")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
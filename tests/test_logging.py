@@ -0,0 +1,162 @@
+"""Logging tests."""
+import json
+import logging
+import sys
+import threading
+from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.logging_config import (
+    ACCESS_LOGGER_NAME,
+    JSONFormatter,
+    configure_logging,
+    create_file_handler,
+    current_request_id,
+    stop_logging,
+)
+from src.main import app
+from src.middleware import AccessLogMiddleware
+
+
+class RecordingHandler(logging.Handler):
+    """Keep emitted records and the threads that emitted them."""
+    
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+    
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+@pytest.fixture
+def recording_handler():
+    """Route logging through the queue to a recording handler, restoring the default setup after."""
+    handler = RecordingHandler()
+    configure_logging(level="INFO", handlers=[handler])
+    yield handler
+    configure_logging()
+
+
+def test_json_formatter_includes_extra_fields_and_exceptions():
+    """Test records format as JSON with their extra fields and traceback."""
+    logger = logging.getLogger("tests.json")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logger.makeRecord(
+            logger.name, logging.ERROR, __file__, 1, "failed %s", ("job",), exc_info=sys.exc_info(),
+            extra={"request_id": "abc", "status": 500}
+        )
+    
+    entry = json.loads(JSONFormatter().format(record))
+    assert entry["message"] == "failed job"
+    assert entry["level"] == "ERROR"
+    assert entry["logger"] == "tests.json"
+    assert entry["request_id"] == "abc"
+    assert entry["status"] == 500
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_records_are_written_by_the_listener_thread(recording_handler):
+    """Test handlers run off the calling thread, with request ids and tracebacks rendered first."""
+    logger = logging.getLogger("tests.queue")
+    token = current_request_id.set("request-1")
+    try:
+        logger.info("hello %s", "world")
+        try:
+            raise RuntimeError("broken")
+        except RuntimeError:
+            logger.exception("failed")
+    finally:
+        current_request_id.reset(token)
+    stop_logging()
+    
+    info, error = recording_handler.records
+    assert info.getMessage() == "hello world"
+    assert info.request_id == "request-1"
+    assert error.exc_info is None
+    assert "RuntimeError: broken" in error.exc_text
+    assert threading.current_thread().name not in recording_handler.threads
+
+
+def test_create_file_handler_rotation(tmp_path):
+    """Test file handlers rotate by size or time."""
+    size_handler = create_file_handler(str(tmp_path / "size.log"), rotation="size", max_bytes=100)
+    time_handler = create_file_handler(str(tmp_path / "time.log"), rotation="time", when="H")
+    try:
+        assert isinstance(size_handler, RotatingFileHandler)
+        assert size_handler.maxBytes == 100
+        assert isinstance(time_handler, TimedRotatingFileHandler)
+    finally:
+        size_handler.close()
+        time_handler.close()
+    
+    with pytest.raises(ValueError):
+        create_file_handler(str(tmp_path / "app.log"), rotation="weekly")
+
+
+def test_forked_workers_log_to_their_own_files(tmp_path):
+    """Test restarting logging after fork reopens the log file under the worker's pid."""
+    import os
+    from src.logging_config import restart_logging_after_fork
+    
+    listener = configure_logging(level="INFO", log_file=str(tmp_path / "app.log"))
+    try:
+        [parent_handler] = [handler for handler in listener.handlers if isinstance(handler, RotatingFileHandler)]
+        restart_logging_after_fork()
+        logging.getLogger("tests.fork").info("from the worker")
+        stop_logging()
+        
+        worker_log = tmp_path / f"app.{os.getpid()}.log"
+        assert "from the worker" in worker_log.read_text()
+        assert "from the worker" not in (tmp_path / "app.log").read_text()
+        assert parent_handler.stream is None
+    finally:
+        configure_logging()
+
+
+def test_access_log_records_request_fields(caplog):
+    """Test each request is logged with its id, route, status and duration."""
+    caplog.set_level(logging.INFO, logger=ACCESS_LOGGER_NAME)
+    client = TestClient(app)
+    
+    response = client.get("/health", headers={"X-Request-ID": "req-123"})
+    assert response.headers["x-request-id"] == "req-123"
+    record = [record for record in caplog.records if record.name == ACCESS_LOGGER_NAME][-1]
+    assert record.request_id == "req-123"
+    assert record.method == "GET"
+    assert record.route == "/health"
+    assert record.status == 200
+    assert record.duration_ms >= 0
+    
+    # Ids that could inject log content are replaced
+    response = client.get("/health", headers={"X-Request-ID": "bad id\nforged"})
+    assert response.headers["x-request-id"] != "bad id\nforged"
+    assert len(response.headers["x-request-id"]) == 32
+
+
+def test_access_log_sampling_keeps_errors(caplog):
+    """Test sampled-out requests aren't logged, while server errors always are."""
+    sampled_app = FastAPI()
+    sampled_app.add_middleware(AccessLogMiddleware, sample_rate=0.0, slow_ms=60000)
+    
+    @sampled_app.get("/ok")
+    async def ok():
+        return {}
+    
+    @sampled_app.get("/error")
+    async def error():
+        raise RuntimeError("broken")
+    
+    caplog.set_level(logging.INFO, logger=ACCESS_LOGGER_NAME)
+    client = TestClient(sampled_app, raise_server_exceptions=False)
+    assert client.get("/ok").status_code == 200
+    assert client.get("/error").status_code == 500
+    
+    access_records = [record for record in caplog.records if record.name == ACCESS_LOGGER_NAME]
+    assert [record.path for record in access_records] == ["/error"]
+    assert access_records[0].status == 500
@@ -0,0 +1,87 @@
+"""Application startup tests."""
+import os
+import re
+import subprocess
+import sys
+from fastapi.testclient import TestClient
+from src.main import app
+
+# Generous enough for slow CI machines; today's import is well under half of this
+IMPORT_TIME_BUDGET_SECONDS = 4.0
+
+
+def _import_src_main(database_url: str) -> subprocess.CompletedProcess:
+    """Import src.main in a fresh interpreter with -X importtime."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import sys, src.main; print('boto3' in sys.modules or 'botocore' in sys.modules)"],
+        cwd=root,
+        env={**os.environ, "DATABASE_URL": database_url},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_import_time_budget(tmp_path):
+    """Test importing the app stays under budget and doesn't load boto3/botocore or touch the database."""
+    database_path = tmp_path / "untouched.db"
+    result = _import_src_main(f"sqlite:///{database_path}")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+    assert not database_path.exists()
+    
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| src\.main$", result.stderr, re.MULTILINE)
+    assert match, "src.main missing from -X importtime output"
+    cumulative_seconds = int(match.group(1)) / 1_000_000
+    assert cumulative_seconds < IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_lifespan_warms_up_and_shuts_down():
+    """Test the app starts and stops cleanly with the lifespan handler."""
+    from src.database import engine
+    
+    with TestClient(app) as client:
+        assert client.get("/health").json() == {"status": "healthy"}
+        pool = engine.pool
+    # Shutdown disposes the sync engine too, replacing its pool
+    assert engine.pool is not pool
+
+
+def test_gunicorn_config():
+    """Test the production config preloads the app and disposes pools after fork."""
+    import runpy
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    config = runpy.run_path(os.path.join(root, "gunicorn.conf.py"))
+    
+    assert config["worker_class"] == "src.workers.UvicornWorker"
+    assert config["workers"] >= 1
+    assert config["preload_app"] is True
+    assert config["max_requests_jitter"] > 0
+    assert callable(config["post_fork"])
+
+
+def test_worker_routes_uvicorn_logs_to_the_queue():
+    """Test building a worker, as the preloaded master does, keeps uvicorn on the logging queue."""
+    import logging
+    from gunicorn.config import Config
+    from gunicorn.glogging import Logger
+    from src.workers import UvicornWorker
+    
+    cfg = Config()
+    worker = UvicornWorker(0, os.getpid(), [], app, 30, cfg, Logger(cfg))
+    assert worker.config.access_log is False
+    for name in ("uvicorn", "uvicorn.error"):
+        uvicorn_logger = logging.getLogger(name)
+        assert uvicorn_logger.handlers == []
+        assert uvicorn_logger.propagate is True
+
+
+def test_dispose_engines_after_fork():
+    """Test each engine gets a fresh pool."""
+    from src.database import async_engine, dispose_engines_after_fork, engine
+    
+    pools = (engine.pool, async_engine.sync_engine.pool)
+    dispose_engines_after_fork()
+    assert engine.pool is not pools[0]
+    assert async_engine.sync_engine.pool is not pools[1]
@@ -0,0 +1,96 @@
+"""Metrics tests."""
+import pytest
+from fastapi.testclient import TestClient
+from src.main import app
+from src.metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    HTTP_REQUESTS_TOTAL,
+    DB_QUERY_DURATION_SECONDS,
+    AUTH_OPERATION_DURATION_SECONDS,
+)
+
+client = TestClient(app)
+
+
+def test_render_prometheus_text():
+    """Test counters and histograms render in the Prometheus text format."""
+    registry = MetricsRegistry()
+    requests = Counter("requests_total", "Requests.", ("path",), registry=registry)
+    latency = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0), registry=registry)
+    
+    requests.inc(path='/a"b')
+    requests.inc(2, path='/a"b')
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+    
+    text = registry.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{path="/a\\"b"} 3' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "latency_seconds_count 3" in text
+    assert "latency_seconds_sum 5.55" in text
+    
+    with pytest.raises(ValueError):
+        requests.inc(route="/a")
+    with pytest.raises(ValueError):
+        Counter("requests_total", "Duplicate.", registry=registry)
+
+
+def test_histogram_timer_as_decorator():
+    """Test a timer decorator records one observation per call."""
+    registry = MetricsRegistry()
+    latency = Histogram("work_seconds", "Work.", ("kind",), registry=registry)
+    
+    @latency.time(kind="test")
+    def work():
+        return 42
+    
+    assert work() == 42
+    assert work() == 42
+    assert latency.get_count(kind="test") == 2
+
+
+def test_http_metrics_use_route_templates():
+    """Test requests are labelled by route template, with unknown paths collapsed."""
+    labels = {"method": "GET", "route": "/api/v1/posts/{post_id}", "status": "404"}
+    unmatched = {"method": "GET", "route": "<unmatched>", "status": "404"}
+    before = HTTP_REQUESTS_TOTAL.get(**labels)
+    before_unmatched = HTTP_REQUESTS_TOTAL.get(**unmatched)
+    
+    client.get("/api/v1/posts/999999")
+    client.get("/api/v1/posts/999998")
+    client.get("/no/such/path/123")
+    
+    assert HTTP_REQUESTS_TOTAL.get(**labels) == before + 2
+    assert HTTP_REQUESTS_TOTAL.get(**unmatched) == before_unmatched + 1
+
+
+def test_metrics_endpoint():
+    """Test /metrics serves HTTP, database and auth metrics."""
+    before = DB_QUERY_DURATION_SECONDS.get_count(engine="primary", operation="SELECT")
+    # Not the public feed, which may already be cached by an earlier test
+    client.get("/api/v1/posts/", params={"published_only": "false"})
+    assert DB_QUERY_DURATION_SECONDS.get_count(engine="primary", operation="SELECT") > before
+    
+    client.get("/api/v1/auth/me", headers={"Authorization": "Bearer not-a-token"})
+    assert AUTH_OPERATION_DURATION_SECONDS.get_count(operation="decode_access_token") >= 1
+    
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/api/v1/posts/",status="200"}' in response.text
+    assert "http_requests_in_progress" in response.text
+    assert "db_query_duration_seconds_bucket" in response.text
+
+
+def test_server_timing_is_off_by_default(monkeypatch):
+    """Test the Server-Timing header must be switched on explicitly."""
+    from src.config import Settings
+    
+    monkeypatch.delenv("SERVER_TIMING_ENABLED", raising=False)
+    assert Settings(_env_file=None).SERVER_TIMING_ENABLED is False
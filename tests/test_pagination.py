@@ -0,0 +1,60 @@
+"""Pagination utility tests."""
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy import select
+from src.cache import TTLCache
+from src.database import AsyncSessionLocal
+from src.pagination import (
+    COUNT_MODE_CACHED,
+    COUNT_MODE_ESTIMATED,
+    PaginatedResponse,
+    count_total,
+    decode_cursor,
+    encode_cursor
+)
+from src.posts.models import Post
+
+
+def test_cursor_round_trip():
+    """Test cursors decode to the position they encode."""
+    created_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+def test_paginated_response_without_total():
+    """Test responses can omit the total."""
+    response = PaginatedResponse.create(items=[], total=None, page=1, page_size=10)
+    assert response.total is None
+    assert response.total_pages is None
+
+
+def test_count_total_cached_mode():
+    """Test cached counts are reused until the cache is cleared."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("posts", 12345)
+    
+    async def count(mode):
+        async with AsyncSessionLocal() as db:
+            return await count_total(db, select(Post), cache=cache, cache_key="posts", mode=mode)
+    
+    assert asyncio.run(count(COUNT_MODE_CACHED)) == (12345, False)
+    
+    # Estimates are Postgres-only, so other databases fall back to the cache
+    assert asyncio.run(count(COUNT_MODE_ESTIMATED)) == (12345, False)
+    
+    cache.clear()
+    total, is_estimate = asyncio.run(count(COUNT_MODE_CACHED))
+    assert total != 12345
+    assert not is_estimate
+    assert cache.get("posts") == total
+
+
+def test_count_mode_setting_rejects_unknown_modes():
+    """Test a misspelled count mode fails at startup instead of silently caching counts."""
+    from pydantic import ValidationError
+    from src.config import Settings
+    
+    assert Settings(PAGINATION_COUNT_MODE="estimated").PAGINATION_COUNT_MODE == "estimated"
+    with pytest.raises(ValidationError):
+        Settings(PAGINATION_COUNT_MODE="exatc")